@@ -0,0 +1,4 @@
+import os
+
+# Repository root, one level up from this package
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
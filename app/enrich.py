@@ -0,0 +1,218 @@
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+import cloudscraper
+import requests
+from bs4 import BeautifulSoup
+
+from app import PROJECT_ROOT, metrics
+from utils.nlp import summarize_text
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = "lxml"
+except ImportError:
+    HTML_PARSER = "html.parser"
+
+ENRICH_CACHE_PATH = os.getenv("ENRICH_CACHE_PATH", os.path.join(PROJECT_ROOT, "app", "data", "enrich_cache.db"))
+ENRICH_WORKERS = int(os.getenv("ENRICH_WORKERS", "16"))
+ENRICH_PER_HOST = int(os.getenv("ENRICH_PER_HOST", "2"))
+ENRICH_TIMEOUT = float(os.getenv("ENRICH_TIMEOUT", "10"))
+ENRICH_MAX_BYTES = int(float(os.getenv("ENRICH_MAX_KB", "1024")) * 1024)
+
+HEADERS = {'User-agent': 'Mozilla/5.0 (compatible; IdeaInbox/1.0)'}
+BOILERPLATE_TAGS = ["script", "style", "noscript", "nav", "header", "footer", "aside", "form", "svg"]
+
+# Hosts behind Cloudflare's bot check, fetched through cloudscraper like the IH spider does
+CLOUDFLARE_HOSTS = {"indiehackers.com", "www.indiehackers.com"}
+
+# Linked pages are streamed with a size cap, so they bypass the raw response cache.
+# Latency is recorded under one label: ideas link to an unbounded set of hosts.
+session = metrics.instrument_session(requests.Session(), host="enrich")
+scraper = metrics.instrument_session(cloudscraper.create_scraper(), host="enrich")
+
+
+# 🚀 **Canonical URLs**
+def canonical_url(url):
+    """
+    Lowercase scheme and host, drop fragments, tracking parameters and trailing slashes.
+    """
+    parts = urlsplit(url.strip())
+    query = urlencode([(k, v) for k, v in parse_qsl(parts.query) if not k.lower().startswith("utm_")])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path.rstrip("/"), query, ""))
+
+
+# 🚀 **Enrichment Cache**
+def is_cacheable(status):
+    """
+    Whether a fetch outcome is worth remembering: a page, or a client error that
+    won't change on retry. Timeouts (None), 5xx, 408 and 429 are transient, and so
+    are 401/403, which bot checks return for pages that may load on a later run.
+    """
+    return status == 200 or (status is not None and 400 <= status < 500 and status not in (401, 403, 408, 429))
+
+
+class EnrichmentCache:
+    """
+    Extracted page content keyed by canonical URL, so no page is fetched twice.
+    Definitive failures (e.g. 404, 410) are cached too, with empty text,
+    to avoid hammering dead links. Transient failures are retried on the next run.
+    """
+
+    def __init__(self, path=ENRICH_CACHE_PATH):
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS pages ("
+            "url TEXT PRIMARY KEY, canonical_url TEXT, title TEXT, description TEXT, "
+            "text TEXT, status INTEGER, fetched_at REAL)"
+        )
+
+    def get(self, url):
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT canonical_url, title, description, text, status FROM pages WHERE url = ?",
+                (canonical_url(url),),
+            ).fetchone()
+        # Rows from before transient failures stopped being cached count as misses
+        if row is None or not is_cacheable(row[4]):
+            return None
+        return dict(zip(("canonical_url", "title", "description", "text", "status"), row))
+
+    def put(self, url, page):
+        # Store under the requested URL and the page's own canonical URL
+        keys = {canonical_url(url), canonical_url(page.get("canonical_url") or url)}
+        with self._lock:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO pages (url, canonical_url, title, description, text, status, fetched_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(key, page.get("canonical_url"), page.get("title"), page.get("description"),
+                  page.get("text"), page.get("status"), time.time()) for key in keys],
+            )
+
+
+# 🚀 **Fetch and Extract**
+_host_limits = defaultdict(lambda: threading.BoundedSemaphore(ENRICH_PER_HOST))
+_host_limits_lock = threading.Lock()
+
+
+def _host_limit(url):
+    with _host_limits_lock:
+        return _host_limits[urlsplit(url).netloc.lower()]
+
+
+def fetch_page(url):
+    """
+    Fetch at most ENRICH_MAX_BYTES of an HTML page. Returns (status, body or None).
+    """
+    client = scraper if urlsplit(url).netloc.lower() in CLOUDFLARE_HOSTS else session
+    with _host_limit(url):
+        with client.get(url, headers=HEADERS, timeout=ENRICH_TIMEOUT, stream=True) as response:
+            if response.status_code != 200 or "html" not in response.headers.get("Content-Type", ""):
+                return response.status_code, None
+            body = bytearray()
+            for chunk in response.iter_content(chunk_size=65536):
+                body.extend(chunk)
+                if len(body) >= ENRICH_MAX_BYTES:
+                    break
+            return response.status_code, bytes(body[:ENRICH_MAX_BYTES])
+
+
+def _meta(soup, *names):
+    for name in names:
+        tag = soup.find("meta", attrs={"property": name}) or soup.find("meta", attrs={"name": name})
+        if tag and tag.get("content"):
+            return tag["content"].strip()
+    return None
+
+
+def extract(body, url):
+    """
+    Pull the title, meta description, canonical URL and main text out of an HTML page.
+    """
+    soup = BeautifulSoup(body, HTML_PARSER)
+    canonical = soup.find("link", rel="canonical")
+    title = _meta(soup, "og:title") or (soup.title.get_text(strip=True) if soup.title else None)
+    description = _meta(soup, "og:description", "description")
+    for tag in soup(BOILERPLATE_TAGS):
+        tag.decompose()
+    main = soup.find("article") or soup.find("main") or soup.body or soup
+    paragraphs = [p.get_text(" ", strip=True) for p in main.find_all("p")]
+    text = "\n".join(p for p in paragraphs if p) or main.get_text(" ", strip=True)
+    return {
+        "canonical_url": canonical.get("href") if canonical and canonical.get("href") else url,
+        "title": title,
+        "description": description,
+        "text": text,
+    }
+
+
+def enrich_page(url, cache):
+    # Enrichment is optional: a bad page, parser error or locked cache must not fail the crawl
+    try:
+        page = cache.get(url)
+        if page is not None:
+            return page
+        status, body = fetch_page(url)
+        page = extract(body, url) if body else {"canonical_url": url}
+        page["status"] = status
+    except Exception as e:
+        logging.warning(f"⚠️  Could not enrich {url}: {e}")
+        return {"canonical_url": url, "status": None}
+    if is_cacheable(status):
+        try:
+            cache.put(url, page)
+        except sqlite3.Error as e:
+            logging.warning(f"⚠️  Could not cache the enrichment of {url}: {e}")
+    return page
+
+
+# 🚀 **Enrich Ideas**
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """
+    Return the process-wide enrichment cache, creating it on first use.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = EnrichmentCache()
+        return _cache
+
+
+def needs_enrichment(idea):
+    link = idea.get("link") or ""
+    description = idea.get("description") or ""
+    return link.startswith(("http://", "https://")) and (not description or description == idea.get("title"))
+
+
+def enrich_ideas(ideas, workers=ENRICH_WORKERS):
+    """
+    Replace placeholder descriptions (empty, or just the title again) with a summary of the
+    linked page. Pages are fetched concurrently, at most ENRICH_PER_HOST at a time per host.
+    """
+    pending = [idea for idea in ideas if needs_enrichment(idea)]
+    if not pending:
+        return ideas
+    cache = get_cache()
+    logging.info(f"🔎 Enriching {len(pending)} ideas from their linked pages...")
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="enrich") as executor:
+        pages = list(executor.map(lambda idea: enrich_page(idea["link"], cache), pending))
+    enriched = 0
+    for idea, page in zip(pending, pages):
+        content = page.get("text") or page.get("description")
+        if content:
+            idea["description"] = summarize_text(content)
+            enriched += 1
+    logging.info(f"✅ Enriched {enriched} of {len(pending)} ideas.")
+    return ideas
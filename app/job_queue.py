@@ -0,0 +1,149 @@
+import json
+import os
+import sqlite3
+import time
+
+from app import PROJECT_ROOT
+
+QUEUE_PATH = os.getenv("JOB_QUEUE_PATH", os.path.join(PROJECT_ROOT, "app", "data", "jobs.db"))
+
+DEFAULT_LEASE_SECONDS = 300
+DEFAULT_MAX_ATTEMPTS = 3
+RETRY_BACKOFF_SECONDS = 30
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'queued',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    max_attempts INTEGER NOT NULL,
+    available_at REAL NOT NULL,
+    lease_owner TEXT,
+    lease_until REAL,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS jobs_ready ON jobs (status, available_at);
+"""
+
+
+# 🚀 **Durable Job Queue**
+class JobQueue:
+    """
+    SQLite-backed job queue shared by every worker process that opens the same file.
+
+    A leased job stays invisible to other workers until its lease expires. Workers
+    keep extending the lease while a job runs, so only a crashed or hung worker's
+    jobs are picked up again, `lease_seconds` after its last heartbeat. The default
+    rollback journal (not WAL) is kept so the file can live on a network mount.
+    """
+
+    def __init__(self, path=QUEUE_PATH, lease_seconds=DEFAULT_LEASE_SECONDS, max_attempts=DEFAULT_MAX_ATTEMPTS):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+
+    def enqueue(self, kind, payload, max_attempts=None, delay=0):
+        now = time.time()
+        cursor = self.conn.execute(
+            "INSERT INTO jobs (kind, payload, max_attempts, available_at, created_at, updated_at) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            (kind, json.dumps(payload), max_attempts or self.max_attempts, now + delay, now, now),
+        )
+        return cursor.lastrowid
+
+    def lease(self, worker_id):
+        """
+        Claim the oldest ready job for `worker_id`, or return None if there is none.
+        Jobs whose lease has expired are treated as ready again, unless they have
+        used up their attempts (their worker crashed or hung each time), in which
+        case they are marked dead.
+        """
+        now = time.time()
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            self.conn.execute(
+                "UPDATE jobs SET status = 'dead', lease_until = NULL, updated_at = ?, "
+                "last_error = COALESCE(last_error, 'Lease expired without the job finishing') "
+                "WHERE status = 'leased' AND lease_until <= ? AND attempts >= max_attempts",
+                (now, now),
+            )
+            row = self.conn.execute(
+                "SELECT * FROM jobs "
+                "WHERE (status = 'queued' AND available_at <= ?) "
+                "   OR (status = 'leased' AND lease_until <= ?) "
+                "ORDER BY available_at, id LIMIT 1",
+                (now, now),
+            ).fetchone()
+            if row is None:
+                self.conn.execute("COMMIT")
+                return None
+            self.conn.execute(
+                "UPDATE jobs SET status = 'leased', lease_owner = ?, lease_until = ?, "
+                "attempts = attempts + 1, updated_at = ? WHERE id = ?",
+                (worker_id, now + self.lease_seconds, now, row["id"]),
+            )
+            self.conn.execute("COMMIT")
+        except Exception:
+            self.conn.execute("ROLLBACK")
+            raise
+        job = dict(row)
+        job["payload"] = json.loads(job["payload"])
+        job["attempts"] += 1
+        return job
+
+    def extend(self, job_id, worker_id):
+        """
+        Push the lease of a running job `lease_seconds` into the future.
+        Returns False if `worker_id` no longer holds the lease.
+        """
+        now = time.time()
+        cursor = self.conn.execute(
+            "UPDATE jobs SET lease_until = ?, updated_at = ? "
+            "WHERE id = ? AND lease_owner = ? AND status = 'leased'",
+            (now + self.lease_seconds, now, job_id, worker_id),
+        )
+        return cursor.rowcount > 0
+
+    def complete(self, job_id, worker_id):
+        """
+        Mark a job done. Returns False if `worker_id` no longer holds the lease.
+        """
+        cursor = self.conn.execute(
+            "UPDATE jobs SET status = 'done', lease_until = NULL, updated_at = ? "
+            "WHERE id = ? AND lease_owner = ? AND status = 'leased'",
+            (time.time(), job_id, worker_id),
+        )
+        return cursor.rowcount > 0
+
+    def fail(self, job, worker_id, error, retry=True):
+        """
+        Put a failed job back on the queue with backoff, or mark it dead after `max_attempts`
+        (or straight away with retry=False). Returns the new status, or None if `worker_id`
+        no longer holds the lease.
+        """
+        now = time.time()
+        if retry and job["attempts"] < job["max_attempts"]:
+            status, available_at = 'queued', now + RETRY_BACKOFF_SECONDS * job["attempts"]
+        else:
+            status, available_at = 'dead', job["available_at"]
+        cursor = self.conn.execute(
+            "UPDATE jobs SET status = ?, available_at = ?, lease_until = NULL, last_error = ?, updated_at = ? "
+            "WHERE id = ? AND lease_owner = ? AND status = 'leased'",
+            (status, available_at, error, now, job["id"], worker_id),
+        )
+        return status if cursor.rowcount > 0 else None
+
+    def stats(self):
+        rows = self.conn.execute("SELECT status, COUNT(*) AS n FROM jobs GROUP BY status").fetchall()
+        return {row["status"]: row["n"] for row in rows}
+
+    def close(self):
+        self.conn.close()
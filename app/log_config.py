@@ -0,0 +1,43 @@
+import atexit
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+from app import PROJECT_ROOT
+
+LOG_FILE = os.path.join(PROJECT_ROOT, 'scraper.log')
+
+_listener = None
+_listener_pid = None
+
+
+def setup_logging(log_file=LOG_FILE, level=logging.INFO):
+    """
+    Send root logging through a QueueHandler so callers never block on log I/O.
+    A background QueueListener writes records to `log_file` and the console.
+    Safe to call from every spider: only the first call in each process configures anything.
+    """
+    global _listener, _listener_pid
+    # A forked worker inherits `_listener` but not its thread, so it needs its own
+    if _listener is not None and _listener_pid == os.getpid():
+        return _listener
+
+    formatter = logging.Formatter('%(asctime)s | %(levelname)s | %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
+    file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
+    console_handler = logging.StreamHandler()
+    for handler in (file_handler, console_handler):
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    root_logger = logging.getLogger()
+    root_logger.handlers.clear()
+    root_logger.addHandler(QueueHandler(log_queue))
+    root_logger.setLevel(level)
+
+    _listener = QueueListener(log_queue, file_handler, console_handler, respect_handler_level=True)
+    _listener_pid = os.getpid()
+    _listener.start()
+    # Drain the queue and flush the file on interpreter exit
+    atexit.register(_listener.stop)
+    return _listener
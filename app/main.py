@@ -1,14 +1,28 @@
+import os
 import sys
-sys.path.append("./")
+# Make the `app` package importable however the server is launched
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from app.routes import router
+from app.scheduler import get_scheduler
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app):
+    # Run recurring crawls inside the API process when RUN_SCHEDULER=1
+    run_scheduler = os.getenv("RUN_SCHEDULER") == "1"
+    if run_scheduler:
+        get_scheduler().start()
+    yield
+    if run_scheduler:
+        get_scheduler().stop()
+
+app = FastAPI(lifespan=lifespan)
 
 @app.get("/")
 def read_root():
     return {"message": "Idea Inbox API is running!"}
 
 # Include the router
-app.include_router(router)
\ No newline at end of file
+app.include_router(router)
@@ -0,0 +1,196 @@
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from datetime import datetime
+from urllib.parse import urlparse
+
+from app import PROJECT_ROOT
+
+RUN_SUMMARY_FILE = os.getenv("RUN_SUMMARY_FILE", os.path.join(PROJECT_ROOT, "run_summaries.jsonl"))
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+REGISTRY = []
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(key, extra=()):
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{value}"' for name, value in pairs) + "}"
+
+
+# 🚀 **Metric Types**
+class Counter:
+    def __init__(self, name, help):
+        self.name = name
+        self.help = help
+        self._values = defaultdict(float)
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def inc(self, amount=1, **labels):
+        with self._lock:
+            self._values[_label_key(labels)] += amount
+
+    def value(self, **labels):
+        return self._values.get(_label_key(labels), 0.0)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        # Copy under the lock: crawl threads may add label sets mid-scrape
+        with self._lock:
+            values = dict(self._values)
+        for key, value in sorted(values.items()):
+            lines.append(f"{self.name}{_format_labels(key)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, help, buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.help = help
+        self.buckets = buckets
+        self._counts = {}
+        self._sums = defaultdict(float)
+        self._lock = threading.Lock()
+        REGISTRY.append(self)
+
+    def observe(self, value, **labels):
+        key = _label_key(labels)
+        with self._lock:
+            counts = self._counts.setdefault(key, [0] * (len(self.buckets) + 1))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[i] += 1
+            counts[-1] += 1
+            self._sums[key] += value
+
+    @contextmanager
+    def time(self, **labels):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels):
+        counts = self._counts.get(_label_key(labels))
+        return counts[-1] if counts else 0
+
+    def sum(self, **labels):
+        return self._sums.get(_label_key(labels), 0.0)
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            all_counts = {key: list(counts) for key, counts in self._counts.items()}
+            sums = dict(self._sums)
+        for key, counts in sorted(all_counts.items()):
+            for bound, count in zip(self.buckets, counts):
+                lines.append(f"{self.name}_bucket{_format_labels(key, [('le', bound)])} {count}")
+            lines.append(f"{self.name}_bucket{_format_labels(key, [('le', '+Inf')])} {counts[-1]}")
+            lines.append(f"{self.name}_sum{_format_labels(key)} {sums[key]}")
+            lines.append(f"{self.name}_count{_format_labels(key)} {counts[-1]}")
+        return lines
+
+
+def render():
+    """
+    Render every registered metric in the Prometheus text exposition format.
+    """
+    lines = []
+    for metric in REGISTRY:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
+
+
+# 🚀 **Crawl Metrics**
+HTTP_LATENCY = Histogram("idea_inbox_http_request_seconds", "HTTP request latency by host.")
+ITEMS_FETCHED = Counter("idea_inbox_items_fetched_total", "Ideas extracted from a source.")
+DEDUP_CHECKED = Counter("idea_inbox_dedup_checked_total", "Ideas checked against existing links.")
+DEDUP_HITS = Counter("idea_inbox_dedup_hits_total", "Ideas skipped because their link already exists.")
+INSERT_LATENCY = Histogram("idea_inbox_insert_seconds", "Latency of batch inserts into Supabase.")
+ROWS_INSERTED = Counter("idea_inbox_rows_inserted_total", "Rows inserted into Supabase.")
+
+
+def _record_response(response, *args, host=None, **kwargs):
+    # Responses replayed from the raw response cache never hit the network
+    if getattr(response, "from_cache", False):
+        return
+    host = host or urlparse(response.url).hostname or "unknown"
+    HTTP_LATENCY.observe(response.elapsed.total_seconds(), host=host)
+
+
+def instrument_session(session, host=None):
+    """
+    Record the latency of every response a requests/cloudscraper session receives.
+    Pass a fixed `host` label for sessions that fetch arbitrary sites, so each new
+    domain doesn't add another set of series.
+    """
+    session.hooks["response"].append(functools.partial(_record_response, host=host) if host else _record_response)
+    return session
+
+
+# 🚀 **Per-Run Summaries**
+_recent_runs = deque(maxlen=100)
+
+
+def _snapshot(source):
+    return {
+        "items_fetched": ITEMS_FETCHED.value(source=source),
+        "dedup_checked": DEDUP_CHECKED.value(source=source),
+        "dedup_hits": DEDUP_HITS.value(source=source),
+        "rows_inserted": ROWS_INSERTED.value(source=source),
+        "insert_seconds": INSERT_LATENCY.sum(source=source),
+    }
+
+
+@contextmanager
+def record_run(source):
+    """
+    Summarize one crawl of `source` as JSON: appended to RUN_SUMMARY_FILE and kept in memory.
+    """
+    before = _snapshot(source)
+    started_at = datetime.now().isoformat()
+    started = time.perf_counter()
+    error = None
+    try:
+        yield
+    except BaseException as e:
+        error = repr(e)
+        raise
+    finally:
+        after = _snapshot(source)
+        delta = {name: after[name] - before[name] for name in after}
+        summary = {
+            "source": source,
+            "started_at": started_at,
+            "duration": round(time.perf_counter() - started, 3),
+            "items_fetched": int(delta["items_fetched"]),
+            "dedup_hit_rate": round(delta["dedup_hits"] / delta["dedup_checked"], 3) if delta["dedup_checked"] else None,
+            "rows_inserted": int(delta["rows_inserted"]),
+            "insert_seconds": round(delta["insert_seconds"], 3),
+            "rows_per_second": round(delta["rows_inserted"] / delta["insert_seconds"], 1) if delta["insert_seconds"] else None,
+            "error": error,
+        }
+        _recent_runs.append(summary)
+        try:
+            with open(RUN_SUMMARY_FILE, "a", encoding="utf-8") as f:
+                f.write(json.dumps(summary) + "\n")
+        except OSError as e:
+            logging.error(f"❌ Failed to write run summary: {e}")
+        logging.info(f"📊 Run summary: {json.dumps(summary)}")
+
+
+def recent_runs(limit=20):
+    return list(_recent_runs)[-limit:]
@@ -0,0 +1,149 @@
+import cProfile
+import contextvars
+import functools
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from datetime import datetime
+
+from app import PROJECT_ROOT
+
+PROFILE_DIR = os.getenv("PROFILE_DIR", os.path.join(PROJECT_ROOT, "profiles"))
+SAMPLE_INTERVAL = float(os.getenv("PROFILE_SAMPLE_INTERVAL", "0.005"))
+
+# PROFILE_CRAWL selects the mode: unset/empty = off, "stages" = per-stage timings only,
+# "cprofile" = stages + a .prof file, "sample" = stages + a collapsed-stack flame graph file
+MODES = ("stages", "cprofile", "sample")
+
+_current_run = contextvars.ContextVar("profile_run", default=None)
+_recent_runs = deque(maxlen=int(os.getenv("PROFILE_HISTORY", "50")))
+
+
+# 🚀 **Stage Timing**
+@contextmanager
+def stage(name):
+    """
+    Add the wall and CPU time of the block to the current profiled run, if any.
+    """
+    run = _current_run.get()
+    if run is None:
+        yield
+        return
+    wall = time.perf_counter()
+    cpu = time.thread_time()
+    try:
+        yield
+    finally:
+        totals = run["stages"].setdefault(name, {"wall": 0.0, "cpu": 0.0, "calls": 0})
+        totals["wall"] += time.perf_counter() - wall
+        totals["cpu"] += time.thread_time() - cpu
+        totals["calls"] += 1
+
+
+# 🚀 **Sampling Profiler**
+class StackSampler:
+    """
+    Sample one thread's Python stack every `interval` seconds and count collapsed stacks.
+    """
+
+    def __init__(self, thread_id, interval=SAMPLE_INTERVAL):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, name="stack-sampler", daemon=True)
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+    def write_collapsed(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+def _profile_path(source, extension):
+    os.makedirs(PROFILE_DIR, exist_ok=True)
+    return os.path.join(PROFILE_DIR, f"{source}-{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}.{extension}")
+
+
+def _run_profiled(source, mode, fn, args, kwargs):
+    run = {"source": source, "mode": mode, "started_at": datetime.now().isoformat(), "stages": {}}
+    token = _current_run.set(run)
+    profiler = cProfile.Profile() if mode == "cprofile" else None
+    sampler = StackSampler(threading.get_ident()) if mode == "sample" else None
+    wall = time.perf_counter()
+    cpu = time.thread_time()
+    if profiler:
+        try:
+            profiler.enable()
+        except ValueError as e:
+            # Python 3.12+ allows one active cProfile per process, e.g. across backfill windows
+            logging.warning(f"⚠️  cProfile unavailable for {source} run: {e}")
+            profiler = None
+    if sampler:
+        sampler.start()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        if profiler:
+            profiler.disable()
+        if sampler:
+            sampler.stop()
+        _current_run.reset(token)
+        run["wall"] = round(time.perf_counter() - wall, 4)
+        run["cpu"] = round(time.thread_time() - cpu, 4)
+        for totals in run["stages"].values():
+            totals["wall"] = round(totals["wall"], 4)
+            totals["cpu"] = round(totals["cpu"], 4)
+        run["unaccounted_wall"] = round(run["wall"] - sum(t["wall"] for t in run["stages"].values()), 4)
+        try:
+            if profiler:
+                run["profile_file"] = _profile_path(source, "prof")
+                profiler.dump_stats(run["profile_file"])
+            if sampler:
+                run["profile_file"] = _profile_path(source, "collapsed")
+                sampler.write_collapsed(run["profile_file"])
+        except OSError as e:
+            logging.error(f"❌ Failed to write profile for {source}: {e}")
+        _recent_runs.append(run)
+        logging.info(f"⏱️  Profiled {source} run: {run['wall']}s wall, {run['cpu']}s CPU, stages {run['stages']}")
+
+
+def profiled(source):
+    """
+    Decorate a spider entry point so runs are profiled when PROFILE_CRAWL is set.
+    """
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            mode = os.getenv("PROFILE_CRAWL", "").lower()
+            # Nested calls are already covered by the outer run
+            if mode not in MODES or _current_run.get() is not None:
+                return fn(*args, **kwargs)
+            return _run_profiled(source, mode, fn, args, kwargs)
+        return wrapper
+    return decorator
+
+
+def recent_runs(limit=20):
+    return list(_recent_runs)[-limit:]
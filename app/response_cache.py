@@ -0,0 +1,277 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# Make the `app` package importable when run as a script
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app import PROJECT_ROOT
+
+CACHE_DIR = os.getenv("RESPONSE_CACHE_DIR", os.path.join(PROJECT_ROOT, "app", "data", "response_cache"))
+CACHE_MAX_BYTES = int(float(os.getenv("RESPONSE_CACHE_MAX_MB", "512")) * 1024 * 1024)
+
+# RESPONSE_CACHE selects the mode: unset/empty = off, "record" = fetch and store every
+# payload, "replay" = serve payloads from the cache and never touch the network
+MODES = ("record", "replay")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS objects (
+    digest TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    key TEXT NOT NULL,
+    method TEXT NOT NULL,
+    url TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    digest TEXT NOT NULL REFERENCES objects (digest)
+);
+CREATE INDEX IF NOT EXISTS entries_key ON entries (key, fetched_at);
+CREATE INDEX IF NOT EXISTS objects_last_used ON objects (last_used);
+"""
+
+
+def request_key(method, url, body=None):
+    """
+    Identify a request by method, URL and body (PH sends its query as a POST body).
+    """
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    body_digest = hashlib.sha256(body or b"").hexdigest()
+    return hashlib.sha256(f"{method} {url} {body_digest}".encode("utf-8")).hexdigest()
+
+
+# 🚀 **Content-Addressed Payload Store**
+class ResponseCache:
+    """
+    Raw HTTP payloads stored zlib-compressed under their SHA-256, so a payload that
+    doesn't change between fetches is stored once. An SQLite index maps each
+    (request, fetch time) to a payload. The least recently used payloads are evicted
+    once the compressed total exceeds `max_bytes`.
+    """
+
+    def __init__(self, path=CACHE_DIR, max_bytes=CACHE_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.join(path, "objects"), exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(os.path.join(path, "index.db"), check_same_thread=False, isolation_level=None)
+        self.conn.executescript(SCHEMA)
+
+    def _object_path(self, digest):
+        return os.path.join(self.path, "objects", digest[:2], digest[2:] + ".z")
+
+    def store(self, method, url, body, status, headers, content, fetched_at=None):
+        digest = hashlib.sha256(content).hexdigest()
+        object_path = self._object_path(digest)
+        now = time.time()
+        with self._lock:
+            exists = self.conn.execute("SELECT size FROM objects WHERE digest = ?", (digest,)).fetchone()
+            if exists is None:
+                compressed = zlib.compress(content, 6)
+                os.makedirs(os.path.dirname(object_path), exist_ok=True)
+                tmp_path = f"{object_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(compressed)
+                os.replace(tmp_path, object_path)
+                self.conn.execute(
+                    "INSERT INTO objects (digest, size, last_used) VALUES (?, ?, ?)",
+                    (digest, len(compressed), now),
+                )
+            else:
+                self.conn.execute("UPDATE objects SET last_used = ? WHERE digest = ?", (now, digest))
+            self.conn.execute(
+                "INSERT INTO entries (key, method, url, fetched_at, status, headers, digest) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (request_key(method, url, body), method, url, fetched_at or now, status, json.dumps(dict(headers)), digest),
+            )
+            self._evict()
+        return digest
+
+    def lookup(self, method, url, body=None, as_of=None):
+        """
+        Return (status, headers, content) of the latest fetch at or before `as_of`, or None.
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT status, headers, digest FROM entries WHERE key = ? AND fetched_at <= ? "
+                "ORDER BY fetched_at DESC LIMIT 1",
+                (request_key(method, url, body), as_of or time.time()),
+            ).fetchone()
+            if row is None:
+                return None
+            status, headers, digest = row
+            self.conn.execute("UPDATE objects SET last_used = ? WHERE digest = ?", (time.time(), digest))
+        try:
+            with open(self._object_path(digest), "rb") as f:
+                content = zlib.decompress(f.read())
+        except OSError:
+            return None
+        return status, json.loads(headers), content
+
+    def _evict(self):
+        total = self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM objects").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for digest, size in self.conn.execute("SELECT digest, size FROM objects ORDER BY last_used").fetchall():
+            self.conn.execute("DELETE FROM entries WHERE digest = ?", (digest,))
+            self.conn.execute("DELETE FROM objects WHERE digest = ?", (digest,))
+            try:
+                os.remove(self._object_path(digest))
+            except OSError:
+                pass
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def stats(self):
+        with self._lock:
+            objects, size = self.conn.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM objects").fetchone()
+            entries = self.conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        return {"entries": entries, "objects": objects, "compressed_bytes": size, "max_bytes": self.max_bytes}
+
+
+# 🚀 **Record/Replay Transport Adapter**
+class CachingAdapter(BaseAdapter):
+    """
+    Wraps a session's existing adapter (e.g. cloudscraper's cipher-suite adapter),
+    recording every payload it fetches or replaying payloads without the network.
+    """
+
+    def __init__(self, inner, cache, mode, as_of=None):
+        super().__init__()
+        self.inner = inner
+        self.cache = cache
+        self.mode = mode
+        self.as_of = as_of
+
+    def send(self, request, **kwargs):
+        if self.mode == "replay":
+            hit = self.cache.lookup(request.method, request.url, request.body, self.as_of)
+            if hit is None:
+                raise requests.ConnectionError(f"No cached response for {request.method} {request.url}", request=request)
+            return self._build_response(request, *hit)
+
+        response = self.inner.send(request, **kwargs)
+        # Streamed bodies are left alone so callers can still cap how much they read
+        if not kwargs.get("stream"):
+            try:
+                self.cache.store(request.method, request.url, request.body,
+                                 response.status_code, response.headers, response.content)
+            except (OSError, sqlite3.Error) as e:
+                logging.error(f"❌ Failed to cache response for {request.url}: {e}")
+        return response
+
+    def _build_response(self, request, status, headers, content):
+        response = requests.Response()
+        response.status_code = status
+        response.headers = CaseInsensitiveDict(headers)
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = content
+        response.url = request.url
+        response.request = request
+        response.reason = "OK (replayed)" if status == 200 else "Replayed"
+        response.elapsed = timedelta(0)
+        # Lets the metrics hook skip replayed responses
+        response.from_cache = True
+        response.connection = self
+        return response
+
+    def close(self):
+        self.inner.close()
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """
+    Return the process-wide response cache, creating it on first use.
+    """
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ResponseCache()
+        return _cache
+
+
+def current_mode():
+    mode = os.getenv("RESPONSE_CACHE", "").lower()
+    return mode if mode in MODES else None
+
+
+def install(session):
+    """
+    Route a requests/cloudscraper session through the cache according to RESPONSE_CACHE.
+    RESPONSE_CACHE_AS_OF (ISO timestamp) replays the payloads as they were at that time.
+    """
+    mode = current_mode()
+    if mode is None:
+        return session
+    as_of = os.getenv("RESPONSE_CACHE_AS_OF")
+    as_of = datetime.fromisoformat(as_of).timestamp() if as_of else None
+    for prefix in ("https://", "http://"):
+        session.mount(prefix, CachingAdapter(session.get_adapter(prefix), get_cache(), mode, as_of))
+    logging.info(f"🗄️  Response cache in {mode} mode at {get_cache().path}")
+    return session
+
+
+def uninstall(session):
+    """
+    Undo install(), putting the session's original adapters back.
+    """
+    for prefix in ("https://", "http://"):
+        adapter = session.get_adapter(prefix)
+        if isinstance(adapter, CachingAdapter):
+            session.mount(prefix, adapter.inner)
+    return session
+
+
+# === CLI ===
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Idea Inbox raw response cache")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("stats", help="show cache size")
+    replay_parser = commands.add_parser("replay", help="rebuild ideas from cached payloads, e.g. hn reddit:SaaS")
+    replay_parser.add_argument("targets", nargs="+")
+    replay_parser.add_argument("--as-of", help="replay payloads as of this ISO timestamp")
+    replay_parser.add_argument("--output", default=os.path.join(PROJECT_ROOT, "app", "data", "replayed_ideas.json"),
+                               help="JSON file the rebuilt ideas are written to")
+    args = parser.parse_args()
+
+    if args.command == "stats":
+        print(get_cache().stats())
+    elif args.command == "replay":
+        # Must be set before the spiders are imported, since they install the cache at import time
+        os.environ["RESPONSE_CACHE"] = "replay"
+        if args.as_of:
+            os.environ["RESPONSE_CACHE_AS_OF"] = args.as_of
+        from app.scheduler import get_spider
+
+        # The spiders only parse (save=False), so nothing is deduped against or written to Supabase
+        rebuilt = {}
+        for target in args.targets:
+            source, _, subreddit = target.partition(":")
+            kwargs = {"subreddit": subreddit} if subreddit else {}
+            rebuilt[target] = get_spider(source)(save=False, **kwargs)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(rebuilt, f, indent=4)
+        print(f"Rebuilt {sum(len(ideas) for ideas in rebuilt.values())} ideas into {args.output}")
@@ -1,20 +1,22 @@
-import cloudscraper
 import os
 from dotenv import load_dotenv
-from supabase import create_client, Client
+from fastapi import APIRouter, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from app import metrics, profiling
+from app.scheduler import SOURCES, get_scheduler
+from app.storage import get_supabase
 
 load_dotenv()
 
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 user_id = os.getenv("USER_ID")
 
-supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+router = APIRouter()
 
 def save_to_supabase(idea):
     try:
         print(f"💾 Attempting to save: {idea['title']}")
-        response = supabase.table('ideas').insert(idea).execute()
+        response = get_supabase().table('ideas').insert(idea).execute()
         
         # === New Logging ===
         if response.status_code == 201 or response.status_code == 200:
@@ -25,3 +27,42 @@ def save_to_supabase(idea):
             print(f"🛑 Data Sent: {idea}")
     except Exception as e:
         print(f"🚨 Error saving to Supabase: {e}")
+
+# 🚀 **Crawl Scheduler Endpoints**
+@router.get("/crawl/status")
+def crawl_status():
+    return get_scheduler().status()
+
+@router.post("/crawl/{source}")
+def trigger_crawl(source: str):
+    if source not in SOURCES:
+        raise HTTPException(status_code=404, detail=f"Unknown source '{source}'")
+    started = get_scheduler().trigger(source)
+    return {"source": source, "started": started, "status": get_scheduler().status()[source]}
+
+# 🚀 **Metrics Endpoints**
+@router.get("/metrics", response_class=PlainTextResponse)
+def prometheus_metrics():
+    return metrics.render()
+
+@router.get("/metrics/runs")
+def recent_run_summaries(limit: int = 20):
+    return metrics.recent_runs(limit)
+
+# 🚀 **Profiling Endpoints**
+@router.get("/profile/runs")
+def recent_profiled_runs(limit: int = 20):
+    return profiling.recent_runs(limit)
+
+# 🚀 **Snapshot Stats Endpoint**
+@router.get("/stats")
+def snapshot_stats():
+    from app import snapshot
+
+    try:
+        return {
+            "ideas_per_source_per_day": snapshot.ideas_per_source_per_day(),
+            "votes": snapshot.vote_distribution(),
+        }
+    except (RuntimeError, FileNotFoundError) as e:
+        raise HTTPException(status_code=503, detail=f"Snapshot unavailable: {e}")
@@ -0,0 +1,197 @@
+import importlib
+import logging
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from app import metrics
+from app.log_config import setup_logging
+
+# 🚀 **Source Registry**
+# Maps a source name to the spider module and the function that crawls it.
+# Spider modules are imported on first use and then stay in sys.modules, so
+# their Supabase clients and HTTP sessions are reused across runs.
+SOURCES = {
+    "hn": ("app.scrapers.hn_spider", "fetch_hn_ideas"),
+    "reddit": ("app.scrapers.reddit_spider", "fetch_reddit_ideas"),
+    "ph": ("app.scrapers.ph_spider", "fetch_ph_ideas"),
+    "ih": ("app.scrapers.ih_spider", "fetch_ih_ideas"),
+}
+
+# Default cadence in seconds. Override with CRAWL_INTERVAL_<SOURCE>, 0 disables.
+DEFAULT_INTERVALS = {
+    "hn": 300,
+    "reddit": 900,
+    "ph": 3600,
+    "ih": 1800,
+}
+
+
+def load_intervals():
+    """
+    Read the per-source crawl intervals from the environment.
+    """
+    return {
+        source: float(os.getenv(f"CRAWL_INTERVAL_{source.upper()}", default))
+        for source, default in DEFAULT_INTERVALS.items()
+    }
+
+
+def get_spider(source):
+    """
+    Return the fetch function for a source, importing its spider on first use.
+    """
+    module_name, func_name = SOURCES[source]
+    module = importlib.import_module(module_name)
+    return getattr(module, func_name)
+
+
+# 🚀 **Crawl Scheduler**
+class Scheduler:
+    def __init__(self, intervals=None, jitter=None):
+        self.intervals = intervals if intervals is not None else load_intervals()
+        self.jitter = jitter if jitter is not None else float(os.getenv("CRAWL_JITTER", "0.1"))
+        self._locks = {source: threading.Lock() for source in SOURCES}
+        self._status = {
+            source: {
+                "running": False,
+                "runs": 0,
+                "last_started": None,
+                "last_finished": None,
+                "last_duration": None,
+                "last_error": None,
+                "next_run": None,
+            }
+            for source in SOURCES
+        }
+        self._executor = ThreadPoolExecutor(max_workers=len(SOURCES), thread_name_prefix="crawl")
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _jittered(self, interval):
+        return interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def trigger(self, source, **kwargs):
+        """
+        Start a crawl of `source` in the background.
+        Returns False if a run of the same source is already in progress.
+        """
+        lock = self._locks[source]
+        if not lock.acquire(blocking=False):
+            logging.info(f"⏭️  Skipping {source}: previous run still in progress.")
+            return False
+        self._status[source]["running"] = True
+        try:
+            if self._executor is None:
+                raise RuntimeError("scheduler is stopped")
+            self._executor.submit(self._run, source, kwargs)
+        except RuntimeError as e:
+            # The executor was shut down by stop(); don't leave the source marked as running
+            self._status[source]["running"] = False
+            lock.release()
+            logging.warning(f"⚠️  Could not start a crawl of {source}: {e}")
+            return False
+        return True
+
+    def _run(self, source, kwargs):
+        status = self._status[source]
+        started = time.perf_counter()
+        status["last_started"] = datetime.now().isoformat()
+        status["last_error"] = None
+        logging.info(f"⏰ Scheduled crawl of {source} started.")
+        try:
+            with metrics.record_run(source):
+                get_spider(source)(**kwargs)
+        except (Exception, SystemExit) as e:
+            status["last_error"] = repr(e)
+            logging.error(f"❌ Scheduled crawl of {source} failed: {e}")
+        finally:
+            status["runs"] += 1
+            status["last_duration"] = round(time.perf_counter() - started, 3)
+            status["last_finished"] = datetime.now().isoformat()
+            status["running"] = False
+            self._locks[source].release()
+            logging.info(f"✅ Scheduled crawl of {source} finished in {status['last_duration']}s.")
+
+    def status(self):
+        return {source: dict(status) for source, status in self._status.items()}
+
+    def _loop(self):
+        # Spread the first runs over the jitter window so sources don't all fire at once
+        now = time.monotonic()
+        next_run = {
+            source: now + random.uniform(0, self.jitter * interval)
+            for source, interval in self.intervals.items()
+            if interval > 0
+        }
+        for source, due in next_run.items():
+            self._set_next_run(source, due)
+        while next_run:
+            timeout = max(0, min(next_run.values()) - time.monotonic())
+            if self._stop.wait(timeout):
+                break
+            now = time.monotonic()
+            for source, due in next_run.items():
+                if due <= now:
+                    self.trigger(source)
+                    next_run[source] = now + self._jittered(self.intervals[source])
+                    self._set_next_run(source, next_run[source])
+        for source in self._status:
+            self._status[source]["next_run"] = None
+
+    def _set_next_run(self, source, due):
+        # Report the wall-clock due time; `due` is on the monotonic clock
+        due_at = datetime.now() + timedelta(seconds=due - time.monotonic())
+        self._status[source]["next_run"] = due_at.isoformat(timespec="seconds")
+
+    def start(self):
+        """
+        Run the scheduling loop in a daemon thread.
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=len(SOURCES), thread_name_prefix="crawl")
+        self._thread = threading.Thread(target=self._loop, name="crawl-scheduler", daemon=True)
+        self._thread.start()
+        logging.info(f"🗓️  Crawl scheduler started with intervals: {self.intervals}")
+
+    def stop(self, wait=False):
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+        logging.info("🛑 Crawl scheduler stopped.")
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_scheduler():
+    """
+    Return the process-wide scheduler, creating it on first use.
+    """
+    global _scheduler
+    with _scheduler_lock:
+        if _scheduler is None:
+            _scheduler = Scheduler()
+        return _scheduler
+
+
+# === Standalone daemon ===
+if __name__ == "__main__":
+    setup_logging()
+    scheduler = get_scheduler()
+    scheduler.start()
+    try:
+        while True:
+            time.sleep(60)
+    except KeyboardInterrupt:
+        scheduler.stop(wait=True)
@@ -0,0 +1,209 @@
+import argparse
+import html
+import json
+import logging
+import os
+import re
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+
+# Make the `app` package importable when run as a script
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from app import metrics, profiling
+from app.scrapers import hn_spider
+
+HN_ALGOLIA_BASE = os.getenv("HN_ALGOLIA_BASE", "https://hn.algolia.com/api/v1")
+CHECKPOINT_FILE = os.getenv(
+    "HN_BACKFILL_CHECKPOINT",
+    os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'data', 'hn_backfill_checkpoint.json')),
+)
+
+DEFAULT_TAGS = "(show_hn,ask_hn)"
+HITS_PER_PAGE = 1000
+# Algolia stops paginating after this many hits, so larger windows get split
+MAX_HITS_PER_QUERY = 1000
+# Keep each insert (and its dedup `in_` query) to a manageable size
+BATCH_SIZE = 200
+
+_checkpoint_lock = threading.Lock()
+
+
+# 🚀 **Time Windows**
+def split_range(start, end, window_seconds):
+    """
+    Split [start, end) into fixed windows so the same arguments always yield the same windows.
+    """
+    windows = []
+    while start < end:
+        windows.append((start, min(start + window_seconds, end)))
+        start += window_seconds
+    return windows
+
+
+def _clean_text(text):
+    return html.unescape(re.sub(r"<[^>]+>", " ", text)).strip()
+
+
+def hit_to_idea(hit):
+    """
+    Map an Algolia hit to the same idea shape fetch_hn_ideas produces.
+    Ask HN posts have no URL, so they link to the HN discussion instead.
+    """
+    link = hit.get("url") or f"https://news.ycombinator.com/item?id={hit['objectID']}"
+    story_text = hit.get("story_text")
+    return {
+        "title": hit.get("title"),
+        "description": _clean_text(story_text) if story_text else hit.get("title"),
+        "link": link,
+        "votes": hit.get("points") or 0,
+        "source": "Hacker News",
+        "user_id": hn_spider.user_id,
+    }
+
+
+# 🚀 **Fetch One Window**
+def fetch_window(start, end, tags=DEFAULT_TAGS):
+    """
+    Yield every hit created in [start, end), splitting the window when Algolia would truncate it.
+    """
+    page = 0
+    while True:
+        params = {
+            "tags": tags,
+            "numericFilters": f"created_at_i>={start},created_at_i<{end}",
+            "hitsPerPage": HITS_PER_PAGE,
+            "page": page,
+        }
+        with profiling.stage("fetch"):
+            response = hn_spider.session.get(f"{HN_ALGOLIA_BASE}/search_by_date", params=params, timeout=30)
+        response.raise_for_status()
+        with profiling.stage("parse"):
+            data = response.json()
+
+        if page == 0 and data.get("nbHits", 0) > MAX_HITS_PER_QUERY and end - start > 1:
+            middle = start + (end - start) // 2
+            yield from fetch_window(start, middle, tags)
+            yield from fetch_window(middle, end, tags)
+            return
+
+        yield from data.get("hits", [])
+        page += 1
+        if page >= data.get("nbPages", 0):
+            return
+
+
+def _save_batch(batch, start, end):
+    # batch_save_to_supabase returns False once its retries are used up
+    if hn_spider.batch_save_to_supabase(batch) is False:
+        raise RuntimeError(f"Batch insert for window {start}-{end} failed")
+
+
+# Profiled per window: the windows run in pool threads, outside the caller's profiled run
+@profiling.profiled("hn_backfill")
+def backfill_window(start, end, tags=DEFAULT_TAGS):
+    """
+    Stream one window into Supabase in batches. Returns the number of hits seen.
+    Raises if a batch can't be inserted, so the window isn't checkpointed.
+    """
+    seen = 0
+    batch = []
+    for hit in fetch_window(start, end, tags):
+        if not hit.get("title"):
+            continue
+        batch.append(hit_to_idea(hit))
+        seen += 1
+        if len(batch) >= BATCH_SIZE:
+            _save_batch(batch, start, end)
+            batch = []
+    if batch:
+        _save_batch(batch, start, end)
+    metrics.ITEMS_FETCHED.inc(seen, source="hn")
+    return seen
+
+
+# 🚀 **Checkpoints**
+def load_checkpoint(path, tags):
+    try:
+        with open(path) as f:
+            return set(json.load(f).get(tags, []))
+    except (OSError, ValueError):
+        return set()
+
+
+def save_checkpoint(path, tags, window):
+    with _checkpoint_lock:
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            data = {}
+        done = set(data.get(tags, []))
+        done.add(window)
+        data[tags] = sorted(done)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, indent=4)
+        os.replace(tmp_path, path)
+
+
+def _window_key(start, end):
+    return f"{start}-{end}"
+
+
+# 🚀 **Backfill a Date Range**
+def backfill_hn(start, end, tags=DEFAULT_TAGS, window_days=30, workers=4, checkpoint=CHECKPOINT_FILE):
+    """
+    Ingest HN stories created in [start, end) (unix seconds), running windows in parallel
+    and skipping windows already recorded in `checkpoint`.
+    """
+    windows = split_range(start, end, int(window_days * 86400))
+    done = load_checkpoint(checkpoint, tags)
+    pending = [w for w in windows if _window_key(*w) not in done]
+    logging.info(f"=== HN backfill: {len(pending)} of {len(windows)} windows pending for tags {tags} ===")
+
+    total = 0
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hn-backfill") as executor:
+        futures = {executor.submit(backfill_window, w_start, w_end, tags): (w_start, w_end) for w_start, w_end in pending}
+        for future in as_completed(futures):
+            window = futures[future]
+            try:
+                count = future.result()
+            except Exception as e:
+                logging.error(f"❌ Backfill window {window} failed, will retry on next run: {e}")
+                continue
+            save_checkpoint(checkpoint, tags, _window_key(*window))
+            total += count
+            logging.info(f"✅ Backfilled window {window}: {count} stories.")
+    logging.info(f"✅ HN backfill complete: {total} stories.")
+    return total
+
+
+def _parse_date(value):
+    return int(datetime.fromisoformat(value).replace(tzinfo=timezone.utc).timestamp())
+
+
+# === CLI ===
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill historical Hacker News stories via Algolia")
+    parser.add_argument("--start", required=True, help="ISO date, e.g. 2020-01-01")
+    parser.add_argument("--end", default=datetime.now(timezone.utc).date().isoformat(), help="ISO date (exclusive)")
+    parser.add_argument("--tags", default=DEFAULT_TAGS)
+    parser.add_argument("--window-days", type=float, default=30)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--checkpoint", default=CHECKPOINT_FILE)
+    parser.add_argument("--enqueue", action="store_true", help="queue one worker job per window instead of running here")
+    args = parser.parse_args()
+
+    start, end = _parse_date(args.start), _parse_date(args.end)
+    if args.enqueue:
+        from app.job_queue import JobQueue
+
+        queue = JobQueue()
+        windows = split_range(start, end, int(args.window_days * 86400))
+        for w_start, w_end in windows:
+            queue.enqueue("hn_backfill", {"start": w_start, "end": w_end, "tags": args.tags})
+        print(f"Queued {len(windows)} backfill windows.")
+    else:
+        backfill_hn(start, end, args.tags, args.window_days, args.workers, args.checkpoint)
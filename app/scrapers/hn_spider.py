@@ -2,9 +2,7 @@ print("SCRIPT STARTING - BEFORE IMPORTS")
 
 import cloudscraper
 import os
-import time
 from dotenv import load_dotenv
-from supabase import create_client, Client
 import logging
 import sys
 import traceback
@@ -12,49 +10,14 @@ import requests
 
 print("IMPORTS COMPLETE")
 
-# === DIRECT FILE WRITE TEST ===
-try:
-    print("TRYING DIRECT FILE WRITE")
-    # Dynamically find the project root (two levels up from this script)
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-    log_file = os.path.join(project_root, 'scraper.log')
-    print(f"Log file will be at: {log_file}")
-    
-    # Try direct write to verify file is writeable
-    with open(log_file, 'a') as f:
-        f.write(f"\n--- HACKER NEWS SCRAPER INIT at {time.strftime('%Y-%m-%d %H:%M:%S')} ---\n")
-        f.write("If you can see this, the file is writable directly.\n")
-    print("DIRECT FILE WRITE SUCCEEDED")
-except Exception as e:
-    print(f"ERROR WRITING TO LOG FILE DIRECTLY: {e}")
-    traceback.print_exc()
+# Make the `app` package importable when run as a script
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from app import enrich, metrics, profiling, response_cache, storage
+from app.log_config import setup_logging
 
 # === LOGGING CONFIGURATION ===
-try:
-    # Remove all handlers associated with the root logger object (prevents duplicate logs)
-    root_logger = logging.getLogger()
-    if root_logger.hasHandlers():
-        root_logger.handlers.clear()
-
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s | %(levelname)s | %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S',
-        handlers=[
-            logging.FileHandler(log_file, mode='a', encoding='utf-8'),
-            logging.StreamHandler()
-        ],
-        force=True
-    )
-
-    logging.info("=== Logging system initialized successfully ===")
-    
-    # Verify handlers are attached
-    print(f"Current logging handlers: {[h.__class__.__name__ for h in logging.getLogger().handlers]}")
-
-except Exception as e:
-    print(f"ERROR SETTING UP LOGGING: {e}")
-    traceback.print_exc()
+setup_logging()
+logging.info("=== Logging system initialized successfully ===")
 
 # === ENVIRONMENT CONFIGURATION ===
 dotenv_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '.env'))
@@ -62,19 +25,23 @@ logging.info(f"Loading .env from: {dotenv_path}")
 logging.info(f"Does .env exist? {os.path.exists(dotenv_path)}")
 load_dotenv(dotenv_path=dotenv_path, override=True)
 
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 user_id = os.getenv("USER_ID")
+HN_API_BASE = os.getenv("HN_API_BASE", "https://hacker-news.firebaseio.com/v0")
+# Summarize linked pages for ideas whose description is just the title
+ENRICH_IDEAS = os.getenv("ENRICH_IDEAS") == "1"
 
 logging.info("Environment variables loaded.")
 
-# Initialize Supabase client
-try:
-    supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-    logging.info("✅ Supabase client initialized successfully.")
-except Exception as e:
-    logging.error(f"❌ Error initializing Supabase client: {e}")
-    exit(1)
+# Supabase client, created on first use so parsing replayed payloads needs no
+# credentials. Assign a client here to override the shared one.
+supabase = None
+
+def get_client():
+    return supabase if supabase is not None else storage.get_supabase()
+
+# Reuse one HTTP session across runs so connections stay warm (and record/replay
+# raw payloads when RESPONSE_CACHE is set)
+session = response_cache.install(metrics.instrument_session(requests.Session()))
 
 # 🚀 **Normalize Links**
 def normalize_link(link):
@@ -88,7 +55,7 @@ def get_existing_links(links):
     if not links:
         return set()
     try:
-        response = supabase.table('ideas').select('link').in_('link', links).execute()
+        response = get_client().table('ideas').select('link').in_('link', links).execute()
         existing_links = {item['link'] for item in response.data} if response.data else set()
         logging.info(f"🔍 Found {len(existing_links)} existing links in Supabase.")
         return existing_links
@@ -110,19 +77,28 @@ def batch_save_to_supabase(ideas, max_retries=3):
         idea['link'] = normalize_link(idea['link'])
 
     links = [idea['link'] for idea in ideas]
-    existing_links = get_existing_links(links)
+    with profiling.stage("dedup"):
+        existing_links = get_existing_links(links)
     new_ideas = [idea for idea in ideas if idea['link'] not in existing_links]
+    metrics.DEDUP_CHECKED.inc(len(ideas), source="hn")
+    metrics.DEDUP_HITS.inc(len(ideas) - len(new_ideas), source="hn")
 
     if not new_ideas:
         logging.warning("⚠️  All ideas are duplicates. Nothing to insert.")
         return
 
+    if ENRICH_IDEAS:
+        with profiling.stage("enrich"):
+            new_ideas = enrich.enrich_ideas(new_ideas)
+
     logging.info(f"📝 Attempting to batch insert {len(new_ideas)} new ideas into Supabase...")
 
     for attempt in range(max_retries):
         try:
-            response = supabase.table('ideas').insert(new_ideas).execute()
+            with metrics.INSERT_LATENCY.time(source="hn"), profiling.stage("insert"):
+                response = get_client().table('ideas').insert(new_ideas).execute()
             if response.data:
+                metrics.ROWS_INSERTED.inc(len(response.data), source="hn")
                 logging.info(f"✅ Successfully inserted {len(response.data)} ideas.")
                 logging.info("Inserted ideas: %s", [idea.get('title') for idea in response.data])
                 return True
@@ -134,19 +110,24 @@ def batch_save_to_supabase(ideas, max_retries=3):
     return False
 
 # 🚀 **Fetch Ideas from Hacker News**
-def fetch_hn_ideas():
+@profiling.profiled("hn")
+def fetch_hn_ideas(save=True):
     logging.info("=== Step 1: Fetching Top Stories IDs ===")
-    url = "https://hacker-news.firebaseio.com/v0/topstories.json"
+    url = f"{HN_API_BASE}/topstories.json"
     
     try:
-        response = requests.get(url)
+        with profiling.stage("fetch"):
+            response = session.get(url)
         if response.status_code == 200:
             story_ids = response.json()[:30]  # Get the top 30 stories
             ideas = []
             
             for story_id in story_ids:
-                story_url = f"https://hacker-news.firebaseio.com/v0/item/{story_id}.json"
-                story_data = requests.get(story_url).json()
+                story_url = f"{HN_API_BASE}/item/{story_id}.json"
+                with profiling.stage("fetch"):
+                    story_response = session.get(story_url)
+                with profiling.stage("parse"):
+                    story_data = story_response.json()
                 
                 if story_data and 'url' in story_data:
                     idea = {
@@ -159,13 +140,20 @@ def fetch_hn_ideas():
                     }
                     ideas.append(idea)
 
-            logging.info("=== Step 2: Batch Saving Ideas ===")
-            batch_save_to_supabase(ideas)
+            metrics.ITEMS_FETCHED.inc(len(ideas), source="hn")
+            # save=False only parses, e.g. to rebuild ideas from replayed payloads
+            if save:
+                logging.info("=== Step 2: Batch Saving Ideas ===")
+                if batch_save_to_supabase(ideas) is False:
+                    raise RuntimeError("Batch insert into Supabase failed")
             logging.info("✅ All ideas processed.")
+            return ideas
         else:
-            logging.error(f"❌ Failed to fetch stories from Hacker News. Status Code: {response.status_code}")
+            raise RuntimeError(f"Failed to fetch stories from Hacker News. Status Code: {response.status_code}")
     except Exception as e:
         logging.error(f"❌ Exception occurred during Hacker News Fetch: {e}")
+        # Re-raise so the scheduler, worker queue and run summaries see the failure
+        raise
 
 # === Test run ===
 if __name__ == "__main__":
@@ -182,11 +170,3 @@ if __name__ == "__main__":
         print("SCRIPT EXECUTION COMPLETE")
 
 print("END OF SCRIPT FILE REACHED")
-
-# Force flush all log handlers at the end
-for handler in logging.getLogger().handlers:
-    try:
-        handler.flush()
-        print(f"Flushed handler: {handler}")
-    except Exception as e:
-        print(f"Error flushing handler: {e}")
@@ -1,58 +1,20 @@
 import cloudscraper
 import os
-import time
 from dotenv import load_dotenv
-from supabase import create_client, Client
 import logging
 import sys
 import traceback
 import requests
 from bs4 import BeautifulSoup
 
-# Direct file write test - at the very start
-try:
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-    log_file = os.path.join(project_root, 'scraper.log')
-    with open(log_file, 'a') as f:
-        f.write(f"\n--- INDIE HACKERS SCRAPER DIRECT WRITE TEST at {time.strftime('%Y-%m-%d %H:%M:%S')} ---\n")
-except Exception as e:
-    print(f"ERROR WITH DIRECT WRITE: {e}")
+# Make the `app` package importable when run as a script
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from app import enrich, metrics, profiling, response_cache, storage
+from app.log_config import setup_logging
 
 # === LOGGING CONFIGURATION ===
-try:
-    # Dynamically find the project root (two levels up from this script)
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-    log_file = os.path.join(project_root, 'scraper.log')
-    
-    # Remove all handlers associated with the root logger object (prevents duplicate logs)
-    root_logger = logging.getLogger()
-    if root_logger.hasHandlers():
-        root_logger.handlers.clear()
-
-    # Create file handler with immediate flush
-    file_handler = logging.FileHandler(log_file, mode='a', encoding='utf-8')
-    file_handler.setLevel(logging.INFO)
-    
-    # Create console handler
-    console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
-    
-    # Create formatter
-    formatter = logging.Formatter('%(asctime)s | %(levelname)s | %(message)s', datefmt='%Y-%m-%d %H:%M:%S')
-    file_handler.setFormatter(formatter)
-    console_handler.setFormatter(formatter)
-    
-    # Set up the root logger
-    logging.basicConfig(level=logging.INFO, handlers=[file_handler, console_handler], force=True)
-    
-    # Explicitly log and flush to verify logging is working
-    logging.info("=== Logging system initialized successfully ===")
-    for handler in logging.getLogger().handlers:
-        handler.flush()
-
-except Exception as e:
-    print(f"ERROR SETTING UP LOGGING: {e}")
-    traceback.print_exc()
+setup_logging()
+logging.info("=== Logging system initialized successfully ===")
 
 # === ENVIRONMENT CONFIGURATION ===
 dotenv_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '.env'))
@@ -60,19 +22,23 @@ logging.info(f"Loading .env from: {dotenv_path}")
 logging.info(f"Does .env exist? {os.path.exists(dotenv_path)}")
 load_dotenv(dotenv_path=dotenv_path, override=True)
 
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 user_id = os.getenv("USER_ID")
+IH_BASE_URL = os.getenv("IH_BASE_URL", "https://www.indiehackers.com")
+# Summarize linked pages for ideas whose description is just the title
+ENRICH_IDEAS = os.getenv("ENRICH_IDEAS") == "1"
 
 logging.info("Environment variables loaded.")
 
-# Initialize Supabase client
-try:
-    supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-    logging.info("✅ Supabase client initialized successfully.")
-except Exception as e:
-    logging.error(f"❌ Error initializing Supabase client: {e}")
-    exit(1)
+# Supabase client, created on first use so parsing replayed payloads needs no
+# credentials. Assign a client here to override the shared one.
+supabase = None
+
+def get_client():
+    return supabase if supabase is not None else storage.get_supabase()
+
+# Reuse one scraper across runs so connections and Cloudflare cookies stay warm (and
+# record/replay raw payloads when RESPONSE_CACHE is set)
+scraper = response_cache.install(metrics.instrument_session(cloudscraper.create_scraper()))
 
 # 🚀 **Normalize Links**
 def normalize_link(link):
@@ -86,7 +52,7 @@ def get_existing_links(links):
     if not links:
         return set()
     try:
-        response = supabase.table('ideas').select('link').in_('link', links).execute()
+        response = get_client().table('ideas').select('link').in_('link', links).execute()
         existing_links = {item['link'] for item in response.data} if response.data else set()
         logging.info(f"🔍 Found {len(existing_links)} existing links in Supabase.")
         return existing_links
@@ -108,19 +74,28 @@ def batch_save_to_supabase(ideas, max_retries=3):
         idea['link'] = normalize_link(idea['link'])
 
     links = [idea['link'] for idea in ideas]
-    existing_links = get_existing_links(links)
+    with profiling.stage("dedup"):
+        existing_links = get_existing_links(links)
     new_ideas = [idea for idea in ideas if idea['link'] not in existing_links]
+    metrics.DEDUP_CHECKED.inc(len(ideas), source="ih")
+    metrics.DEDUP_HITS.inc(len(ideas) - len(new_ideas), source="ih")
 
     if not new_ideas:
         logging.warning("⚠️  All ideas are duplicates. Nothing to insert.")
         return
 
+    if ENRICH_IDEAS:
+        with profiling.stage("enrich"):
+            new_ideas = enrich.enrich_ideas(new_ideas)
+
     logging.info(f"📝 Attempting to batch insert {len(new_ideas)} new ideas into Supabase...")
 
     for attempt in range(max_retries):
         try:
-            response = supabase.table('ideas').insert(new_ideas).execute()
+            with metrics.INSERT_LATENCY.time(source="ih"), profiling.stage("insert"):
+                response = get_client().table('ideas').insert(new_ideas).execute()
             if response.data:
+                metrics.ROWS_INSERTED.inc(len(response.data), source="ih")
                 logging.info(f"✅ Successfully inserted {len(response.data)} ideas.")
                 logging.info("Inserted ideas: %s", [idea.get('title') for idea in response.data])
                 return True
@@ -132,20 +107,20 @@ def batch_save_to_supabase(ideas, max_retries=3):
     return False
 
 # 🚀 **Fetch Ideas from Indie Hackers**
-def fetch_ih_ideas():
+@profiling.profiled("ih")
+def fetch_ih_ideas(save=True):
     logging.info("=== Step 1: Fetching Latest Indie Hackers Posts ===")
-    for handler in logging.getLogger().handlers:
-        handler.flush()
-    
-    url = "https://www.indiehackers.com/post"
+    url = f"{IH_BASE_URL}/post"
     
     try:
-        scraper = cloudscraper.create_scraper()
-        response = scraper.get(url)
+        # Includes any Cloudflare challenge cloudscraper has to solve
+        with profiling.stage("fetch"):
+            response = scraper.get(url)
         
         if response.status_code == 200:
-            soup = BeautifulSoup(response.content, 'html.parser')
-            posts = soup.find_all('a', class_='title-link')
+            with profiling.stage("parse"):
+                soup = BeautifulSoup(response.content, 'html.parser')
+                posts = soup.find_all('a', class_='title-link')
 
             ideas = []
             for post in posts:
@@ -162,22 +137,20 @@ def fetch_ih_ideas():
                 }
                 ideas.append(idea)
 
-            logging.info("=== Step 2: Batch Saving Ideas ===")
-            for handler in logging.getLogger().handlers:
-                handler.flush()
-                
-            batch_save_to_supabase(ideas)
+            metrics.ITEMS_FETCHED.inc(len(ideas), source="ih")
+            # save=False only parses, e.g. to rebuild ideas from replayed payloads
+            if save:
+                logging.info("=== Step 2: Batch Saving Ideas ===")
+                if batch_save_to_supabase(ideas) is False:
+                    raise RuntimeError("Batch insert into Supabase failed")
             logging.info("✅ All ideas processed.")
-            for handler in logging.getLogger().handlers:
-                handler.flush()
+            return ideas
         else:
-            logging.error(f"❌ Failed to fetch stories from Indie Hackers. Status Code: {response.status_code}")
-            for handler in logging.getLogger().handlers:
-                handler.flush()
+            raise RuntimeError(f"Failed to fetch stories from Indie Hackers. Status Code: {response.status_code}")
     except Exception as e:
         logging.error(f"❌ Exception occurred during Indie Hackers Fetch: {e}")
-        for handler in logging.getLogger().handlers:
-            handler.flush()
+        # Re-raise so the scheduler, worker queue and run summaries see the failure
+        raise
 
 # === Test run ===
 if __name__ == "__main__":
@@ -187,14 +160,3 @@ if __name__ == "__main__":
     except Exception as e:
         logging.error(f"Error in main execution: {e}")
         traceback.print_exc()
-
-# Force flush all log handlers at the end
-for handler in logging.getLogger().handlers:
-    handler.flush()
-
-# Final direct write test
-try:
-    with open(log_file, 'a') as f:
-        f.write(f"--- INDIE HACKERS SCRAPER COMPLETED at {time.strftime('%Y-%m-%d %H:%M:%S')} ---\n\n")
-except Exception as e:
-    print(f"ERROR WITH FINAL DIRECT WRITE: {e}")
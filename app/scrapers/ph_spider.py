@@ -1,57 +1,17 @@
 import cloudscraper
 import os
-import time
 from dotenv import load_dotenv
-from supabase import create_client, Client
 import logging
 import sys
-import traceback
-
-# === DIRECT FILE WRITE TEST ===
-try:
-    # Dynamically find the project root (two levels up from this script)
-    project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
-    log_file = os.path.join(project_root, 'scraper.log')
-    print(f"Log file will be at: {log_file}")
-    
-    # Try direct write to verify file is writeable
-    with open(log_file, 'a') as f:
-        f.write(f"\n--- DIRECT WRITE TEST at {time.strftime('%Y-%m-%d %H:%M:%S')} ---\n")
-        f.write("If you can see this, the file is writable directly.\n")
-except Exception as e:
-    print(f"ERROR WRITING TO LOG FILE DIRECTLY: {e}")
-    traceback.print_exc()
 
-# === LOGGING CONFIGURATION ===
-try:
-    # Remove all handlers associated with the root logger object (prevents duplicate logs)
-    root_logger = logging.getLogger()
-    if root_logger.hasHandlers():
-        root_logger.handlers.clear()
-
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s | %(levelname)s | %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S',
-        handlers=[
-            logging.FileHandler(log_file, mode='a', encoding='utf-8'),
-            logging.StreamHandler()
-        ],
-        force=True  # Only available in Python 3.8+
-    )
-
-    logging.info("=== Logging system initialized successfully ===")
-    
-    # Verify handlers are attached
-    print(f"Current logging handlers: {[h.__class__.__name__ for h in logging.getLogger().handlers]}")
-    
-    # Second direct write test to check if logging might be working but not visible
-    with open(log_file, 'a') as f:
-        f.write("--- After logging setup direct write test ---\n")
+# Make the `app` package importable when run as a script
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+from app import metrics, profiling, response_cache, storage
+from app.log_config import setup_logging
 
-except Exception as e:
-    print(f"ERROR SETTING UP LOGGING: {e}")
-    traceback.print_exc()
+# === LOGGING CONFIGURATION ===
+setup_logging()
+logging.info("=== Logging system initialized successfully ===")
 
 # === ENVIRONMENT CONFIGURATION ===
 dotenv_path = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '.env'))
@@ -59,19 +19,21 @@ logging.info(f"Loading .env from: {dotenv_path}")
 logging.info(f"Does .env exist? {os.path.exists(dotenv_path)}")
 load_dotenv(dotenv_path=dotenv_path, override=True)
 
-SUPABASE_URL = os.getenv("SUPABASE_URL")
-SUPABASE_KEY = os.getenv("SUPABASE_KEY")
 user_id = os.getenv("USER_ID")
+PH_API_URL = os.getenv("PH_API_URL", "https://api.producthunt.com/v2/api/graphql")
 
 logging.info("Environment variables loaded.")
 
-# Initialize Supabase client
-try:
-    supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-    logging.info("✅ Supabase client initialized successfully.")
-except Exception as e:
-    logging.error(f"❌ Error initializing Supabase client: {e}")
-    exit(1)
+# Supabase client, created on first use so parsing replayed payloads needs no
+# credentials. Assign a client here to override the shared one.
+supabase = None
+
+def get_client():
+    return supabase if supabase is not None else storage.get_supabase()
+
+# Reuse one scraper across runs so connections and Cloudflare cookies stay warm (and
+# record/replay raw payloads when RESPONSE_CACHE is set)
+scraper = response_cache.install(metrics.instrument_session(cloudscraper.create_scraper()))
 
 # 🚀 **Normalize Links**
 def normalize_link(link):
@@ -85,7 +47,7 @@ def get_existing_links(links):
     if not links:
         return set()
     try:
-        response = supabase.table('ideas').select('link').in_('link', links).execute()
+        response = get_client().table('ideas').select('link').in_('link', links).execute()
         existing_links = {item['link'] for item in response.data} if response.data else set()
         logging.info(f"🔍 Found {len(existing_links)} existing links in Supabase.")
         return existing_links
@@ -107,8 +69,11 @@ def batch_save_to_supabase(ideas, max_retries=3):
         idea['link'] = normalize_link(idea['link'])
 
     links = [idea['link'] for idea in ideas]
-    existing_links = get_existing_links(links)
+    with profiling.stage("dedup"):
+        existing_links = get_existing_links(links)
     new_ideas = [idea for idea in ideas if idea['link'] not in existing_links]
+    metrics.DEDUP_CHECKED.inc(len(ideas), source="ph")
+    metrics.DEDUP_HITS.inc(len(ideas) - len(new_ideas), source="ph")
 
     if not new_ideas:
         logging.warning("⚠️  All ideas are duplicates. Nothing to insert.")
@@ -118,8 +83,10 @@ def batch_save_to_supabase(ideas, max_retries=3):
 
     for attempt in range(max_retries):
         try:
-            response = supabase.table('ideas').insert(new_ideas).execute()
+            with metrics.INSERT_LATENCY.time(source="ph"), profiling.stage("insert"):
+                response = get_client().table('ideas').insert(new_ideas).execute()
             if response.data:
+                metrics.ROWS_INSERTED.inc(len(response.data), source="ph")
                 logging.info(f"✅ Successfully inserted {len(response.data)} ideas.")
                 logging.info("Inserted ideas: %s", [idea.get('title') for idea in response.data])
                 return True
@@ -131,14 +98,16 @@ def batch_save_to_supabase(ideas, max_retries=3):
     return False
 
 # 🚀 **Fetch Ideas from Product Hunt**
-def fetch_ph_ideas():
+@profiling.profiled("ph")
+def fetch_ph_ideas(save=True):
     logging.info("=== Step 1: Fetching API Key ===")
     api_key = os.getenv("PH_API_KEY")
     logging.info("PH_API_KEY loaded.")
 
-    if not api_key:
+    # Replayed payloads are looked up by URL and query, so no key is needed
+    if not api_key and response_cache.current_mode() != "replay":
         logging.warning("⚠️  PH_API_KEY is missing! Please set it in your environment variables.")
-        return []
+        raise RuntimeError("PH_API_KEY is not set")
 
     headers = {
         "Authorization": f"Bearer {api_key}",
@@ -146,7 +115,7 @@ def fetch_ph_ideas():
         "Content-Type": "application/json"
     }
 
-    url = "https://api.producthunt.com/v2/api/graphql"
+    url = PH_API_URL
     query = """
     {
       posts(order: VOTES, first: 10) {
@@ -163,19 +132,21 @@ def fetch_ph_ideas():
     """
     
     try:
-        logging.info("=== Step 2: Creating Cloudscraper Session ===")
-        scraper = cloudscraper.create_scraper()
+        logging.info("=== Step 2: Reusing Cloudscraper Session ===")
         
         logging.info("=== Step 3: Sending POST request to Product Hunt API ===")
-        response = scraper.post(url, json={"query": query}, headers=headers)
+        # Includes any Cloudflare challenge cloudscraper has to solve
+        with profiling.stage("fetch"):
+            response = scraper.post(url, json={"query": query}, headers=headers)
 
         logging.info("=== Step 4: Response Received ===")
         logging.info(f"Status Code: {response.status_code}")
-        logging.info(f"Response Text: {response.text}")
+        logging.debug("Response Text: %s", response.text)
 
         if response.status_code == 200:
             logging.info("=== Step 5: Parsing Response ===")
-            data = response.json()
+            with profiling.stage("parse"):
+                data = response.json()
             posts = data.get("data", {}).get("posts", {}).get("edges", [])
 
             ideas = []
@@ -191,22 +162,23 @@ def fetch_ph_ideas():
                 }
                 ideas.append(idea)
             
-            logging.info("=== Step 6: Batch Saving Ideas ===")
-            batch_save_to_supabase(ideas)
+            metrics.ITEMS_FETCHED.inc(len(ideas), source="ph")
+            # save=False only parses, e.g. to rebuild ideas from replayed payloads
+            if save:
+                logging.info("=== Step 6: Batch Saving Ideas ===")
+                if batch_save_to_supabase(ideas) is False:
+                    raise RuntimeError("Batch insert into Supabase failed")
             logging.info("✅ All ideas processed.")
+            return ideas
         else:
-            logging.error(f"❌ Failed to fetch data from Product Hunt. Status Code: {response.status_code}")
-            logging.error(f"🔍 Response JSON: {response.json()}")
-            return []
+            logging.error(f"🔍 Response Text: {response.text}")
+            raise RuntimeError(f"Failed to fetch data from Product Hunt. Status Code: {response.status_code}")
     except Exception as e:
         logging.error(f"❌ Exception occurred during Product Hunt Fetch: {e}")
-        return []
+        # Re-raise so the scheduler, worker queue and run summaries see the failure
+        raise
 
 # === Test run ===
 if __name__ == "__main__":
     logging.info("=== Testing Product Hunt Scraper ===")
     fetch_ph_ideas()
-
-# Force flush all log handlers at the end
-for handler in logging.getLogger().handlers:
-    handler.flush()
\ No newline at end of file
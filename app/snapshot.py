@@ -0,0 +1,228 @@
+import json
+import logging
+import os
+import sys
+from datetime import datetime, timezone
+
+# Make the `app` package importable when run as a script
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from app import PROJECT_ROOT
+
+SNAPSHOT_DIR = os.getenv("SNAPSHOT_DIR", os.path.join(PROJECT_ROOT, "app", "data", "snapshots"))
+VAULT_PATH = os.path.join(PROJECT_ROOT, "app", "data", "idea_vault.json")
+# Files starting with "_" are skipped when pyarrow discovers the dataset
+STATE_FILE = "_state.json"
+SUPABASE_PAGE_SIZE = 1000
+
+# idea_vault.json keys platforms differently from the `source` the spiders store
+VAULT_SOURCES = {
+    "hackernews": "Hacker News",
+    "reddit": "Reddit",
+    "producthunt": "Product Hunt",
+    "indiehackers": "Indie Hackers",
+}
+
+COLUMNS = ["title", "description", "link", "votes", "source", "created_at"]
+
+
+def _pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.compute
+        import pyarrow.dataset
+        import pyarrow.fs
+    except ImportError as e:
+        raise RuntimeError("Parquet snapshots need pyarrow: pip install pyarrow") from e
+    return pyarrow
+
+
+def _parse_time(value):
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    # Vault timestamps are naive; treat them as UTC like Supabase's
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+# 🚀 **Corpus Readers**
+def read_vault(since=None, path=VAULT_PATH):
+    with open(path) as f:
+        data = json.load(f)
+    for platform, ideas in data.items():
+        for idea in ideas:
+            created_at = _parse_time(idea["timestamp"])
+            if since and created_at <= since:
+                continue
+            yield {
+                "title": idea.get("title"),
+                "description": idea.get("description"),
+                "link": idea.get("link"),
+                "votes": idea.get("votes"),
+                "source": VAULT_SOURCES.get(platform, platform),
+                "created_at": created_at,
+            }
+
+
+def read_supabase(since=None):
+    """
+    Page through the `ideas` table in created_at order, starting after `since`.
+    Rows from one batch insert share a created_at, so `id` breaks ties; otherwise
+    Postgres may order a tie group differently per page and duplicate or skip rows.
+    """
+    from app.storage import get_supabase
+
+    start = 0
+    while True:
+        query = get_supabase().table('ideas').select(",".join(COLUMNS))
+        if since:
+            query = query.gt("created_at", since.isoformat())
+        response = query.order("created_at").order("id").range(start, start + SUPABASE_PAGE_SIZE - 1).execute()
+        rows = response.data or []
+        for row in rows:
+            row["created_at"] = _parse_time(row["created_at"])
+            yield row
+        if len(rows) < SUPABASE_PAGE_SIZE:
+            return
+        start += SUPABASE_PAGE_SIZE
+
+
+READERS = {
+    "vault": read_vault,
+    "supabase": read_supabase,
+}
+
+
+# 🚀 **Incremental Snapshot Export**
+def _load_state(root):
+    try:
+        with open(os.path.join(root, STATE_FILE)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_state(root, state):
+    path = os.path.join(root, STATE_FILE)
+    with open(f"{path}.tmp", "w") as f:
+        json.dump(state, f, indent=4)
+    os.replace(f"{path}.tmp", path)
+
+
+def export_snapshot(origin="supabase", root=SNAPSHOT_DIR):
+    """
+    Append ideas newer than the last export from `origin` to a Parquet dataset
+    partitioned by source and date (hive layout, zstd-compressed). Each run adds
+    new files instead of rewriting existing ones. Returns the number of rows written.
+    """
+    pa = _pyarrow()
+    os.makedirs(root, exist_ok=True)
+    state = _load_state(root)
+    watermark = state.get(origin)
+    since = _parse_time(watermark) if watermark else None
+
+    rows = list(READERS[origin](since))
+    if not rows:
+        logging.info(f"📦 Snapshot of {origin} is up to date.")
+        return 0
+
+    table = pa.table({
+        "title": pa.array([r.get("title") for r in rows], pa.string()),
+        "description": pa.array([r.get("description") for r in rows], pa.string()),
+        "link": pa.array([r.get("link") for r in rows], pa.string()),
+        "votes": pa.array([r.get("votes") for r in rows], pa.int64()),
+        "created_at": pa.array([r["created_at"] for r in rows], pa.timestamp("us", tz="UTC")),
+        "source": pa.array([r.get("source") or "unknown" for r in rows], pa.string()),
+        "date": pa.array([r["created_at"].date().isoformat() for r in rows], pa.string()),
+    })
+    run_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+    pa.dataset.write_dataset(
+        table,
+        root,
+        format="parquet",
+        partitioning=["source", "date"],
+        partitioning_flavor="hive",
+        basename_template=f"{origin}-{run_id}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+        file_options=pa.dataset.ParquetFileFormat().make_write_options(compression="zstd"),
+    )
+
+    state[origin] = max(r["created_at"] for r in rows).isoformat()
+    _save_state(root, state)
+    logging.info(f"📦 Wrote {len(rows)} {origin} ideas to the snapshot at {root}.")
+    return len(rows)
+
+
+# 🚀 **Query Helpers**
+def load_snapshot(columns=None, root=SNAPSHOT_DIR):
+    """
+    Read the snapshot as an Arrow table, memory-mapping the Parquet files.
+    Raises FileNotFoundError if nothing has been exported to `root` yet.
+    """
+    pa = _pyarrow()
+    dataset = pa.dataset.dataset(
+        root,
+        format="parquet",
+        partitioning="hive",
+        filesystem=pa.fs.LocalFileSystem(use_mmap=True),
+    )
+    # An export that found no rows still creates `root`, but the partition columns
+    # only exist once a Parquet file has been written
+    if not dataset.files:
+        raise FileNotFoundError(f"No snapshot files in {root}")
+    return dataset.to_table(columns=columns)
+
+
+def ideas_per_source_per_day(root=SNAPSHOT_DIR):
+    table = load_snapshot(["source", "date", "link"], root)
+    counts = table.group_by(["source", "date"]).aggregate([("link", "count")])
+    rows = [
+        {"source": r["source"], "date": str(r["date"]), "ideas": r["link_count"]}
+        for r in counts.to_pylist()
+    ]
+    return sorted(rows, key=lambda r: (r["source"], r["date"]))
+
+
+def vote_distribution(root=SNAPSHOT_DIR):
+    pa = _pyarrow()
+    table = load_snapshot(["source", "votes"], root)
+    stats = table.group_by("source").aggregate([
+        ("votes", "count"),
+        ("votes", "mean"),
+        ("votes", "min"),
+        ("votes", "max"),
+        ("votes", "tdigest", pa.compute.TDigestOptions(q=[0.5, 0.9, 0.99])),
+    ])
+    result = {}
+    for r in stats.to_pylist():
+        quantiles = r["votes_tdigest"] or []
+        result[r["source"]] = {
+            "count": r["votes_count"],
+            "mean": r["votes_mean"],
+            "min": r["votes_min"],
+            "max": r["votes_max"],
+            "p50": quantiles[0] if len(quantiles) > 0 else None,
+            "p90": quantiles[1] if len(quantiles) > 1 else None,
+            "p99": quantiles[2] if len(quantiles) > 2 else None,
+        }
+    return result
+
+
+# === CLI ===
+if __name__ == "__main__":
+    import argparse
+
+    from app.log_config import setup_logging
+
+    setup_logging()
+    parser = argparse.ArgumentParser(description="Idea Inbox Parquet snapshots")
+    commands = parser.add_subparsers(dest="command", required=True)
+    export_parser = commands.add_parser("export", help="append new ideas to the snapshot")
+    export_parser.add_argument("--from", dest="origin", choices=sorted(READERS), default="supabase")
+    commands.add_parser("stats", help="print per-day counts and vote distributions")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        export_snapshot(args.origin)
+    elif args.command == "stats":
+        print(json.dumps({
+            "ideas_per_source_per_day": ideas_per_source_per_day(),
+            "votes": vote_distribution(),
+        }, indent=4))
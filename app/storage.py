@@ -1,8 +1,31 @@
 import json
+import os
+import threading
 from datetime import datetime
 
+from dotenv import load_dotenv
+
+from app import PROJECT_ROOT
+
 FILE_PATH = "app/data/idea_vault.json"
 
+_supabase = None
+_supabase_lock = threading.Lock()
+
+def get_supabase():
+    """
+    Create the Supabase client on first use, so nothing needs credentials or
+    network (or pays for the supabase import) until it actually talks to the DB.
+    Usable as a FastAPI dependency: `supabase = Depends(get_supabase)`.
+    """
+    global _supabase
+    with _supabase_lock:
+        if _supabase is None:
+            from supabase import create_client
+            load_dotenv(os.path.join(PROJECT_ROOT, ".env"))
+            _supabase = create_client(os.getenv("SUPABASE_URL"), os.getenv("SUPABASE_KEY"))
+        return _supabase
+
 def save_ideas(platform, ideas):
     try:
         with open(FILE_PATH, "r") as file:
@@ -0,0 +1,185 @@
+import argparse
+import logging
+import multiprocessing
+import os
+import socket
+import threading
+import time
+import traceback
+from contextlib import contextmanager
+
+from app import metrics
+from app.job_queue import QUEUE_PATH, JobQueue
+from app.log_config import setup_logging
+from app.scheduler import SOURCES, get_spider
+
+POLL_INTERVAL = float(os.getenv("WORKER_POLL_INTERVAL", "2"))
+# Stop renewing a job's lease after this long, so a hung job is eventually retried or marked dead
+MAX_JOB_SECONDS = float(os.getenv("WORKER_MAX_JOB_SECONDS", "3600"))
+
+
+# 🚀 **Job Handlers**
+def run_crawl_job(payload):
+    """
+    Crawl one source. `kwargs` is passed through to the spider, e.g. {"subreddit": "SaaS"}.
+    """
+    with metrics.record_run(payload["source"]):
+        get_spider(payload["source"])(**payload.get("kwargs", {}))
+
+
+def run_hn_backfill_job(payload):
+    """
+    Backfill one HN time window, as queued by `python -m app.scrapers.hn_backfill --enqueue`.
+    """
+    from app.scrapers import hn_backfill
+
+    with metrics.record_run("hn"):
+        hn_backfill.backfill_window(payload["start"], payload["end"], payload["tags"])
+
+
+def run_enrich_job(payload):
+    """
+    Enrich already-stored ideas ({"ideas": [{"title", "description", "link"}, ...]})
+    and write the new descriptions back to Supabase.
+    """
+    from app import enrich
+    from app.storage import get_supabase
+
+    ideas = [dict(idea) for idea in payload["ideas"]]
+    originals = [idea.get("description") for idea in ideas]
+    enrich.enrich_ideas(ideas)
+    for idea, original in zip(ideas, originals):
+        if idea.get("description") != original:
+            get_supabase().table('ideas').update({"description": idea["description"]}).eq("link", idea["link"]).execute()
+
+
+# Maps a job kind to the function that executes its payload
+JOB_HANDLERS = {
+    "crawl": run_crawl_job,
+    "hn_backfill": run_hn_backfill_job,
+    "enrich": run_enrich_job,
+}
+
+
+def enqueue_crawl(queue, source, **kwargs):
+    if source not in SOURCES:
+        raise ValueError(f"Unknown source '{source}'")
+    return queue.enqueue("crawl", {"source": source, "kwargs": kwargs})
+
+
+# 🚀 **Lease Heartbeat**
+@contextmanager
+def lease_heartbeat(queue, job, worker_id, max_seconds=MAX_JOB_SECONDS):
+    """
+    Keep extending `job`'s lease while the block runs, so long crawls and backfills
+    aren't handed to a second worker. Uses its own connection from a background thread.
+    """
+    stop = threading.Event()
+    interval = queue.lease_seconds / 3
+
+    def beat():
+        heartbeat_queue = JobQueue(queue.path, lease_seconds=queue.lease_seconds)
+        deadline = time.monotonic() + max_seconds
+        try:
+            while not stop.wait(interval):
+                if time.monotonic() > deadline:
+                    logging.warning(f"⚠️  Job {job['id']} ran past {max_seconds}s, no longer renewing its lease.")
+                    return
+                if not heartbeat_queue.extend(job["id"], worker_id):
+                    logging.warning(f"⚠️  Lost the lease on job {job['id']}.")
+                    return
+        finally:
+            heartbeat_queue.close()
+
+    thread = threading.Thread(target=beat, name=f"lease-{job['id']}", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        stop.set()
+        thread.join()
+
+
+# 🚀 **Worker Loop**
+def work(queue_path=QUEUE_PATH, poll_interval=POLL_INTERVAL, max_jobs=None):
+    """
+    Lease and run jobs until interrupted (or until `max_jobs` have been processed).
+    """
+    setup_logging()
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    queue = JobQueue(queue_path)
+    processed = 0
+    logging.info(f"👷 Worker {worker_id} polling {queue_path}")
+    try:
+        while max_jobs is None or processed < max_jobs:
+            job = queue.lease(worker_id)
+            if job is None:
+                time.sleep(poll_interval)
+                continue
+            handler = JOB_HANDLERS.get(job["kind"])
+            if handler is None:
+                # Retrying can't help, so don't burn the remaining attempts
+                queue.fail(job, worker_id, f"No handler for job kind '{job['kind']}'", retry=False)
+                logging.error(f"❌ Job {job['id']} has unknown kind '{job['kind']}', marked dead.")
+                processed += 1
+                continue
+            try:
+                with lease_heartbeat(queue, job, worker_id):
+                    handler(job["payload"])
+                if queue.complete(job["id"], worker_id):
+                    logging.info(f"✅ Job {job['id']} ({job['kind']}) done.")
+                else:
+                    logging.warning(f"⚠️  Job {job['id']} ({job['kind']}) finished after its lease was lost.")
+            except (Exception, SystemExit) as e:
+                status = queue.fail(job, worker_id, traceback.format_exc())
+                logging.error(f"❌ Job {job['id']} ({job['kind']}) failed, now {status or 'owned by another worker'}: {e}")
+            processed += 1
+    except KeyboardInterrupt:
+        pass
+    finally:
+        queue.close()
+
+
+def run_pool(workers, queue_path=QUEUE_PATH, poll_interval=POLL_INTERVAL):
+    """
+    Start `workers` processes consuming the same queue file.
+    """
+    processes = [
+        multiprocessing.Process(target=work, args=(queue_path, poll_interval), name=f"worker-{i}")
+        for i in range(workers)
+    ]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        for process in processes:
+            process.join()
+
+
+# === CLI ===
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Idea Inbox crawl worker pool")
+    parser.add_argument("--queue", default=QUEUE_PATH, help="path to the SQLite queue file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="start the worker pool")
+    run_parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+
+    enqueue_parser = commands.add_parser("enqueue", help="queue crawl jobs, e.g. hn reddit:SaaS")
+    enqueue_parser.add_argument("targets", nargs="+")
+
+    commands.add_parser("stats", help="show job counts by status")
+
+    args = parser.parse_args()
+    if args.command == "run":
+        run_pool(args.workers, args.queue)
+    elif args.command == "enqueue":
+        queue = JobQueue(args.queue)
+        for target in args.targets:
+            source, _, subreddit = target.partition(":")
+            kwargs = {"subreddit": subreddit} if subreddit else {}
+            print(f"Queued job {enqueue_crawl(queue, source, **kwargs)}: {target}")
+    elif args.command == "stats":
+        print(JobQueue(args.queue).stats())
@@ -0,0 +1,55 @@
+from collections import defaultdict
+from types import SimpleNamespace
+
+
+# 🚀 **In-Memory Supabase Stand-in**
+class _Query:
+    def __init__(self, rows):
+        self.rows = rows
+        self._action = None
+        self._columns = None
+        self._filters = []
+        self._payload = None
+
+    def select(self, columns="*"):
+        self._action = "select"
+        self._columns = None if columns == "*" else [c.strip() for c in columns.split(",")]
+        return self
+
+    def insert(self, payload):
+        self._action = "insert"
+        self._payload = payload if isinstance(payload, list) else [payload]
+        return self
+
+    def in_(self, column, values):
+        self._filters.append((column, set(values)))
+        return self
+
+    def execute(self):
+        if self._action == "insert":
+            inserted = [dict(row) for row in self._payload]
+            self.rows.extend(inserted)
+            return SimpleNamespace(data=inserted, count=len(inserted), status_code=201)
+        matched = [
+            row for row in self.rows
+            if all(row.get(column) in values for column, values in self._filters)
+        ]
+        if self._columns:
+            matched = [{c: row.get(c) for c in self._columns} for row in matched]
+        return SimpleNamespace(data=matched, count=len(matched), status_code=200)
+
+
+class InMemorySupabase:
+    """
+    Covers the subset of the supabase-py client the spiders use:
+    table().select().in_().execute() and table().insert().execute().
+    """
+
+    def __init__(self):
+        self.tables = defaultdict(list)
+
+    def table(self, name):
+        return _Query(self.tables[name])
+
+    def reset(self):
+        self.tables.clear()
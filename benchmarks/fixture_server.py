@@ -0,0 +1,170 @@
+import copy
+import json
+import math
+import os
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def load_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+# 🚀 **Scaled Fixture Payloads**
+def build_payloads(scale):
+    """
+    Build every response body once, replicating the recorded fixtures `scale` times.
+    """
+    hn_ids = json.loads(load_fixture("hn_topstories.json"))
+    hn_ids = [hn_ids[0] + i for i in range(scale)]
+    hn_item = json.loads(load_fixture("hn_item.json"))
+
+    reddit = json.loads(load_fixture("reddit_top.json"))
+    child = reddit["data"]["children"][0]
+    children = []
+    for i in range(scale):
+        item = copy.deepcopy(child)
+        item["data"]["title"] = f"{item['data']['title']} #{i}"
+        item["data"]["permalink"] = item["data"]["permalink"].rstrip("/") + f"_{i}/"
+        children.append(item)
+    reddit["data"]["children"] = children
+    reddit["data"]["dist"] = scale
+
+    ph = json.loads(load_fixture("ph_posts.json"))
+    edge = ph["data"]["posts"]["edges"][0]
+    edges = []
+    for i in range(scale):
+        item = copy.deepcopy(edge)
+        item["node"]["name"] = f"{item['node']['name']} {i}"
+        item["node"]["url"] = item["node"]["url"].replace("?", f"-{i}?")
+        edges.append(item)
+    ph["data"]["posts"]["edges"] = edges
+
+    ih_post = load_fixture("ih_post.html")
+    ih_posts = "\n".join(ih_post.replace('-1a2b3c4d5e"', f'-{i}"') for i in range(scale))
+    ih_page = load_fixture("ih_page.html").replace("{{posts}}", ih_posts)
+
+    return {
+        "scale": scale,
+        "hn_algolia_hit": json.loads(load_fixture("hn_algolia_hit.json")),
+        "hn_topstories": json.dumps(hn_ids).encode(),
+        "hn_item": hn_item,
+        "reddit_top": json.dumps(reddit).encode(),
+        "ph_posts": json.dumps(ph).encode(),
+        "ih_page": ih_page.encode(),
+        "article": load_fixture("article.html").encode(),
+    }
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out in separate writes; with Nagle on, every request on a
+    # kept-alive connection stalls ~40ms on delayed ACK and swamps the timings
+    disable_nagle_algorithm = True
+    payloads = {}
+
+    def _send(self, body, content_type="application/json", status=200):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _algolia_search(self, query):
+        """
+        Mimic Algolia's search_by_date: `scale` stories per day, 1000-hit pagination limit.
+        """
+        bounds = dict(re.findall(r"created_at_i([<>]=?)(\d+)", query["numericFilters"][0]))
+        low, high = int(bounds.get(">=", 0)), int(bounds.get("<", 0))
+        spacing = 86400 / self.payloads["scale"]
+        first, last = math.ceil(low / spacing), math.ceil(high / spacing)
+        hits_per_page = int(query.get("hitsPerPage", ["20"])[0])
+        page = int(query.get("page", ["0"])[0])
+        nb_hits = max(0, last - first)
+        hits = []
+        for k in range(first + page * hits_per_page, min(last, first + (page + 1) * hits_per_page)):
+            hit = dict(self.payloads["hn_algolia_hit"])
+            hit["objectID"] = str(k)
+            hit["created_at_i"] = int(k * spacing)
+            hit["title"] = f"{hit['title']} #{k}"
+            hit["url"] = f"{hit['url']}/{k}"
+            hits.append(hit)
+        return {
+            "hits": hits,
+            "nbHits": nb_hits,
+            "page": page,
+            "nbPages": math.ceil(min(nb_hits, 1000) / hits_per_page),
+            "hitsPerPage": hits_per_page,
+        }
+
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path == "/algolia/api/v1/search_by_date":
+            return self._send(json.dumps(self._algolia_search(parse_qs(urlparse(self.path).query))).encode())
+        if path == "/hn/v0/topstories.json":
+            return self._send(self.payloads["hn_topstories"])
+        match = re.fullmatch(r"/hn/v0/item/(\d+)\.json", path)
+        if match:
+            item = dict(self.payloads["hn_item"])
+            item["id"] = int(match.group(1))
+            item["title"] = f"{item['title']} #{item['id']}"
+            item["url"] = f"{item['url']}/{item['id']}"
+            return self._send(json.dumps(item).encode())
+        if re.fullmatch(r"/reddit/r/[^/]+/top/\.json", path):
+            return self._send(self.payloads["reddit_top"])
+        if path.startswith("/articles/"):
+            return self._send(self.payloads["article"], content_type="text/html; charset=utf-8")
+        if path == "/ih/post":
+            return self._send(self.payloads["ih_page"], content_type="text/html; charset=utf-8")
+        self._send(b'{"error": "not found"}', status=404)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+        self.rfile.read(length)
+        if self.path == "/ph/graphql":
+            return self._send(self.payloads["ph_posts"])
+        self._send(b'{"error": "not found"}', status=404)
+
+    def log_message(self, format, *args):
+        pass
+
+
+# 🚀 **Local Stand-in Server**
+class FixtureServer:
+    """
+    Serve the recorded fixtures on localhost in a background thread.
+    `env()` returns the spider base-URL overrides that point at it.
+    """
+
+    def __init__(self, scale=30, host="127.0.0.1", port=0):
+        handler = type("ScaledFixtureHandler", (FixtureHandler,), {"payloads": build_payloads(scale)})
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def env(self):
+        return {
+            "HN_API_BASE": f"{self.url}/hn/v0",
+            "HN_ALGOLIA_BASE": f"{self.url}/algolia/api/v1",
+            "REDDIT_BASE_URL": f"{self.url}/reddit",
+            "PH_API_URL": f"{self.url}/ph/graphql",
+            "IH_BASE_URL": f"{self.url}/ih",
+        }
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
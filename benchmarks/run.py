@@ -0,0 +1,269 @@
+"""
+Offline benchmark suite for the spiders and the storage layer.
+
+Serves recorded fixtures from a local stand-in HTTP server and swaps each
+spider's Supabase client for an in-memory one, so nothing touches the network.
+
+    python -m benchmarks.run --scale 1000 --output bench_results.json
+    python -m benchmarks.run --compare bench_results.json
+"""
+import argparse
+import importlib
+import json
+import logging
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+# Make the `app` package importable when run as a script
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app import storage
+from app.scheduler import SOURCES
+from benchmarks.fake_supabase import InMemorySupabase
+from benchmarks.fixture_server import FixtureServer, build_payloads
+
+STORAGE_SIZES = (1_000, 10_000, 100_000)
+
+
+def timed(fn, repeat=1):
+    times = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - started)
+    return times
+
+
+def make_ideas(n, source="Benchmark"):
+    return [
+        {
+            "title": f"Idea {i}",
+            "description": f"Description for idea {i}",
+            "link": f"https://example.com/ideas/{i}/",
+            "votes": i % 500,
+            "source": source,
+            "user_id": "benchmark",
+        }
+        for i in range(n)
+    ]
+
+
+def load_spiders(server, store):
+    """
+    Import every spider against the stand-in server and in-memory store.
+    """
+    from app import response_cache
+
+    os.environ.update(server.env())
+    os.environ.setdefault("SUPABASE_URL", server.url)
+    os.environ.setdefault("SUPABASE_KEY", "benchmark.benchmark.benchmark")
+    modules = {}
+    for source, (module_name, func_name) in SOURCES.items():
+        module = importlib.import_module(module_name)
+        # The spiders reload .env with override=True, so re-point them explicitly
+        for name, value in server.env().items():
+            if hasattr(module, name):
+                setattr(module, name, value)
+        module.supabase = store
+        # .env or the environment can turn these on; enrichment would fetch the fixtures'
+        # live article links and the response cache would replay or record payloads
+        module.ENRICH_IDEAS = False
+        for session_name in ("session", "scraper"):
+            if hasattr(module, session_name):
+                response_cache.uninstall(getattr(module, session_name))
+        modules[source] = (module, getattr(module, func_name))
+    os.environ.setdefault("PH_API_KEY", "benchmark")
+    return modules
+
+
+# 🚀 **Benchmarks**
+def bench_crawl(modules, store, repeat):
+    """
+    End-to-end fetch_* time. The first run inserts everything, later runs are all duplicates.
+    """
+    results = {}
+    for source, (module, fetch) in modules.items():
+        store.reset()
+        times = timed(fetch, repeat)
+        results[f"crawl.{source}.first"] = times[0]
+        if len(times) > 1:
+            results[f"crawl.{source}.repeat_median"] = statistics.median(times[1:])
+    return results
+
+
+def bench_parse(scale, repeat):
+    from bs4 import BeautifulSoup
+
+    payloads = build_payloads(scale)
+    hn_item = json.dumps(payloads["hn_item"]).encode()
+    return {
+        # HN returns one item body per story, so decode `scale` of them
+        "parse.hn": min(timed(lambda: [json.loads(hn_item) for _ in range(scale)], repeat)),
+        "parse.reddit": min(timed(lambda: json.loads(payloads["reddit_top"]), repeat)),
+        "parse.ph": min(timed(lambda: json.loads(payloads["ph_posts"]), repeat)),
+        "parse.ih": min(timed(
+            lambda: BeautifulSoup(payloads["ih_page"], 'html.parser').find_all('a', class_='title-link'),
+            repeat,
+        )),
+    }
+
+
+def bench_dedup(module, store, repeat):
+    results = {}
+    for n in STORAGE_SIZES:
+        store.reset()
+        existing = make_ideas(n)
+        store.table('ideas').insert(existing).execute()
+        # Half of the candidate links already exist
+        links = [idea['link'] for idea in make_ideas(n + n // 2)][n // 2:]
+        results[f"dedup.{n}"] = min(timed(lambda: module.get_existing_links(links), repeat))
+    return results
+
+
+def bench_batch_save(module, store):
+    results = {}
+    for n in STORAGE_SIZES:
+        store.reset()
+        ideas = make_ideas(n)
+        elapsed = timed(lambda: module.batch_save_to_supabase(ideas))[0]
+        results[f"batch_save.{n}.seconds"] = elapsed
+        results[f"batch_save.{n}.rows_per_second"] = n / elapsed
+    return results
+
+
+def bench_backfill(server, store, scale):
+    """
+    Backfill 30 days of Algolia results (`scale` stories per day) through hn_backfill.
+    """
+    from app.scrapers import hn_backfill
+
+    hn_backfill.HN_ALGOLIA_BASE = server.env()["HN_ALGOLIA_BASE"]
+    store.reset()
+    start = 1_600_000_000
+    with tempfile.TemporaryDirectory() as tmp:
+        checkpoint = os.path.join(tmp, "checkpoint.json")
+        elapsed = timed(lambda: hn_backfill.backfill_hn(start, start + 30 * 86400, window_days=7, checkpoint=checkpoint))[0]
+    stories = len(store.tables['ideas'])
+    return {
+        "backfill.hn.seconds": elapsed,
+        "backfill.hn.rows_per_second": stories / elapsed,
+    }
+
+
+def bench_enrich(server, scale):
+    """
+    Enrich `scale` ideas linking to fixture articles, cold and then from the enrichment cache.
+    """
+    from app import enrich
+
+    with tempfile.TemporaryDirectory() as tmp:
+        enrich._cache = enrich.EnrichmentCache(os.path.join(tmp, "enrich_cache.db"))
+        try:
+            def run():
+                ideas = [{"title": f"Idea {i}", "description": f"Idea {i}", "link": f"{server.url}/articles/{i}"}
+                         for i in range(scale)]
+                enrich.enrich_ideas(ideas)
+            cold, cached = timed(run, 2)
+        finally:
+            enrich._cache = None
+    return {
+        "enrich.cold_seconds": cold,
+        "enrich.cached_seconds": cached,
+    }
+
+
+def bench_save_ideas():
+    results = {}
+    original_path = storage.FILE_PATH
+    with tempfile.TemporaryDirectory() as tmp:
+        storage.FILE_PATH = os.path.join(tmp, "idea_vault.json")
+        try:
+            for n in STORAGE_SIZES:
+                with open(storage.FILE_PATH, "w") as f:
+                    json.dump({}, f)
+                ideas = make_ideas(n)
+                # The second call appends to a vault that already holds n ideas
+                first, second = timed(lambda: storage.save_ideas("benchmark", [dict(i) for i in ideas]), 2)
+                results[f"save_ideas.{n}.seconds"] = first
+                results[f"save_ideas.{n}.rows_per_second"] = n / first
+                results[f"save_ideas.{n}.append_seconds"] = second
+        finally:
+            storage.FILE_PATH = original_path
+    return results
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except Exception:
+        return None
+
+
+def compare(results, baseline_path, tolerance):
+    """
+    Print metrics that got slower than `tolerance` relative to a previous run.
+    Throughput metrics (rows_per_second) regress when they go down.
+    """
+    with open(baseline_path) as f:
+        baseline = json.load(f)["results"]
+    regressions = []
+    for name, value in results.items():
+        old = baseline.get(name)
+        if not old:
+            continue
+        ratio = old / value if name.endswith("rows_per_second") else value / old
+        if ratio > 1 + tolerance:
+            regressions.append(name)
+            print(f"❌ {name}: {old:.6g} -> {value:.6g} ({ratio:.2f}x worse)")
+    if not regressions:
+        print(f"✅ No regressions beyond {tolerance:.0%} against {baseline_path}")
+    return regressions
+
+
+# === CLI ===
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Idea Inbox offline benchmarks")
+    parser.add_argument("--scale", type=int, default=1000, help="items per listing served by the fixture server")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", default="bench_results.json")
+    parser.add_argument("--compare", help="previous results file to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    parser.add_argument("--verbose", action="store_true", help="keep spider INFO logging on")
+    args = parser.parse_args()
+
+    store = InMemorySupabase()
+    with FixtureServer(scale=args.scale) as server:
+        modules = load_spiders(server, store)
+        if not args.verbose:
+            logging.getLogger().setLevel(logging.WARNING)
+        results = {}
+        results.update(bench_crawl(modules, store, args.repeat))
+        results.update(bench_parse(args.scale, args.repeat))
+        hn_module = modules["hn"][0]
+        results.update(bench_dedup(hn_module, store, args.repeat))
+        results.update(bench_batch_save(hn_module, store))
+        results.update(bench_backfill(server, store, args.scale))
+        results.update(bench_enrich(server, args.scale))
+        results.update(bench_save_ideas())
+
+    report = {
+        "timestamp": datetime.now().isoformat(),
+        "revision": git_revision(),
+        "python": platform.python_version(),
+        "scale": args.scale,
+        "repeat": args.repeat,
+        "results": results,
+    }
+    # Compare before writing, in case --output points at the baseline file
+    regressions = compare(results, args.compare, args.tolerance) if args.compare else []
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=4)
+    print(f"📊 Wrote {len(results)} benchmark results to {args.output}")
+    if regressions:
+        sys.exit(1)
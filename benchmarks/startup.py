@@ -0,0 +1,85 @@
+"""
+Cold-start benchmark for the API: time from a fresh interpreter to the app being
+ready to serve (imports done and lifespan startup complete).
+
+    python -m benchmarks.startup --runs 5 --target 1.0
+    python -m benchmarks.startup --importtime   # show the slowest imports
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+# Runs in a fresh interpreter; prints seconds from the first app import to "ready"
+READY_SNIPPET = """
+import asyncio, time
+started = time.perf_counter()
+from app.main import app
+async def ready():
+    async with app.router.lifespan_context(app):
+        pass
+asyncio.run(ready())
+print(time.perf_counter() - started)
+"""
+
+
+def measure_once():
+    started = time.perf_counter()
+    output = subprocess.check_output([sys.executable, "-c", READY_SNIPPET], cwd=project_root, text=True)
+    process_seconds = time.perf_counter() - started
+    return float(output.strip().splitlines()[-1]), process_seconds
+
+
+def slowest_imports(limit=15):
+    """
+    Parse `python -X importtime` output and return the imports with the largest cumulative time.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "from app.main import app"],
+        cwd=project_root, capture_output=True, text=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(cumulative_us), name.strip()))
+    return sorted(rows, reverse=True)[:limit]
+
+
+# === CLI ===
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Idea Inbox API cold-start benchmark")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--target", type=float, default=1.0, help="seconds; exit non-zero if the median is slower")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--importtime", action="store_true", help="list the slowest imports")
+    args = parser.parse_args()
+
+    samples = [measure_once() for _ in range(args.runs)]
+    import_to_ready = statistics.median(s[0] for s in samples)
+    process_total = statistics.median(s[1] for s in samples)
+    print(f"⏱️  import-to-ready: {import_to_ready:.3f}s median, whole process: {process_total:.3f}s median")
+
+    if args.importtime:
+        for cumulative_us, name in slowest_imports():
+            print(f"{cumulative_us / 1e6:8.3f}s  {name}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "runs": args.runs,
+                "import_to_ready": import_to_ready,
+                "process_total": process_total,
+                "target": args.target,
+            }, f, indent=4)
+
+    if import_to_ready > args.target:
+        print(f"❌ Slower than the {args.target}s target")
+        sys.exit(1)
+    print(f"✅ Within the {args.target}s target")
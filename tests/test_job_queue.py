@@ -0,0 +1,82 @@
+import time
+
+import pytest
+
+from app.job_queue import JobQueue
+
+LEASE_SECONDS = 0.05
+
+
+@pytest.fixture
+def queue(tmp_path):
+    queue = JobQueue(str(tmp_path / "jobs.db"), lease_seconds=LEASE_SECONDS, max_attempts=2)
+    yield queue
+    queue.close()
+
+
+def expire_lease():
+    time.sleep(LEASE_SECONDS * 2)
+
+
+def test_expired_lease_is_leased_again(queue):
+    job_id = queue.enqueue("crawl", {"source": "hn"})
+    first = queue.lease("worker-a")
+    assert first["id"] == job_id and first["attempts"] == 1
+    assert queue.lease("worker-b") is None
+
+    expire_lease()
+    second = queue.lease("worker-b")
+    assert second["id"] == job_id and second["attempts"] == 2
+
+
+def test_expired_lease_is_dead_after_max_attempts(queue):
+    queue.enqueue("crawl", {"source": "hn"})
+    for _ in range(2):
+        assert queue.lease("worker-a") is not None
+        expire_lease()
+
+    assert queue.lease("worker-a") is None
+    assert queue.stats() == {"dead": 1}
+
+
+def test_extend_keeps_the_lease(queue):
+    queue.enqueue("crawl", {"source": "hn"})
+    job = queue.lease("worker-a")
+    for _ in range(4):
+        time.sleep(LEASE_SECONDS / 2)
+        assert queue.extend(job["id"], "worker-a")
+    assert queue.lease("worker-b") is None
+    assert queue.complete(job["id"], "worker-a")
+    assert queue.stats() == {"done": 1}
+
+
+def test_complete_and_fail_after_lease_lost(queue):
+    queue.enqueue("crawl", {"source": "hn"})
+    stale = queue.lease("worker-a")
+    expire_lease()
+    current = queue.lease("worker-b")
+
+    assert not queue.extend(stale["id"], "worker-a")
+    assert not queue.complete(stale["id"], "worker-a")
+    assert queue.fail(stale, "worker-a", "boom") is None
+    assert queue.stats() == {"leased": 1}
+
+    assert queue.complete(current["id"], "worker-b")
+    assert queue.stats() == {"done": 1}
+
+
+def test_fail_retries_then_dies(queue):
+    queue.enqueue("crawl", {"source": "hn"})
+    job = queue.lease("worker-a")
+    assert queue.fail(job, "worker-a", "boom") == "queued"
+
+    queue.conn.execute("UPDATE jobs SET available_at = 0")
+    job = queue.lease("worker-a")
+    assert queue.fail(job, "worker-a", "boom") == "dead"
+
+
+def test_fail_without_retry_is_dead_on_first_attempt(queue):
+    queue.enqueue("unknown", {})
+    job = queue.lease("worker-a")
+    assert queue.fail(job, "worker-a", "no handler", retry=False) == "dead"
+    assert queue.lease("worker-a") is None